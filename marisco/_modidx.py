@@ -18,6 +18,21 @@ d = { 'settings': { 'branch': 'main',
                                                                                            'marisco/callbacks.py'),
                                    'marisco.callbacks.Callback': ('api/callbacks.html#callback', 'marisco/callbacks.py'),
                                    'marisco.callbacks.Callback.__init__': ('api/callbacks.html#callback.__init__', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.CheckpointCache': ('api/callbacks.html#checkpointcache', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.CheckpointCache.__init__': ( 'api/callbacks.html#checkpointcache.__init__',
+                                                                                   'marisco/callbacks.py'),
+                                   'marisco.callbacks.CheckpointCache.clear': ( 'api/callbacks.html#checkpointcache.clear',
+                                                                                'marisco/callbacks.py'),
+                                   'marisco.callbacks.CheckpointCache.evict': ( 'api/callbacks.html#checkpointcache.evict',
+                                                                                'marisco/callbacks.py'),
+                                   'marisco.callbacks.CheckpointCache.has': ( 'api/callbacks.html#checkpointcache.has',
+                                                                              'marisco/callbacks.py'),
+                                   'marisco.callbacks.CheckpointCache.key': ( 'api/callbacks.html#checkpointcache.key',
+                                                                              'marisco/callbacks.py'),
+                                   'marisco.callbacks.CheckpointCache.load': ( 'api/callbacks.html#checkpointcache.load',
+                                                                               'marisco/callbacks.py'),
+                                   'marisco.callbacks.CheckpointCache.save': ( 'api/callbacks.html#checkpointcache.save',
+                                                                               'marisco/callbacks.py'),
                                    'marisco.callbacks.CompareDfsAndTfmCB': ( 'api/callbacks.html#comparedfsandtfmcb',
                                                                              'marisco/callbacks.py'),
                                    'marisco.callbacks.CompareDfsAndTfmCB.__call__': ( 'api/callbacks.html#comparedfsandtfmcb.__call__',
@@ -28,29 +43,73 @@ d = { 'settings': { 'branch': 'main',
                                                                                               'marisco/callbacks.py'),
                                    'marisco.callbacks.CompareDfsAndTfmCB._initialize_tfm_attributes': ( 'api/callbacks.html#comparedfsandtfmcb._initialize_tfm_attributes',
                                                                                                         'marisco/callbacks.py'),
+                                   'marisco.callbacks.CompareDfsAndTfmCB._source_rows': ( 'api/callbacks.html#comparedfsandtfmcb._source_rows',
+                                                                                          'marisco/callbacks.py'),
                                    'marisco.callbacks.DecodeTimeCB': ('api/callbacks.html#decodetimecb', 'marisco/callbacks.py'),
                                    'marisco.callbacks.DecodeTimeCB.__init__': ( 'api/callbacks.html#decodetimecb.__init__',
                                                                                 'marisco/callbacks.py'),
                                    'marisco.callbacks.DecodeTimeCB.each_grp': ( 'api/callbacks.html#decodetimecb.each_grp',
                                                                                 'marisco/callbacks.py'),
+                                   'marisco.callbacks.DistinctIndex': ('api/callbacks.html#distinctindex', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.DistinctIndex.__init__': ( 'api/callbacks.html#distinctindex.__init__',
+                                                                                 'marisco/callbacks.py'),
+                                   'marisco.callbacks.DistinctIndex.factorize': ( 'api/callbacks.html#distinctindex.factorize',
+                                                                                  'marisco/callbacks.py'),
+                                   'marisco.callbacks.DistinctIndex.invalidate': ( 'api/callbacks.html#distinctindex.invalidate',
+                                                                                   'marisco/callbacks.py'),
+                                   'marisco.callbacks.DistinctIndex.unique': ( 'api/callbacks.html#distinctindex.unique',
+                                                                               'marisco/callbacks.py'),
+                                   'marisco.callbacks.DistinctIndex.value_counts': ( 'api/callbacks.html#distinctindex.value_counts',
+                                                                                     'marisco/callbacks.py'),
                                    'marisco.callbacks.EncodeTimeCB': ('api/callbacks.html#encodetimecb', 'marisco/callbacks.py'),
                                    'marisco.callbacks.EncodeTimeCB.__init__': ( 'api/callbacks.html#encodetimecb.__init__',
                                                                                 'marisco/callbacks.py'),
                                    'marisco.callbacks.EncodeTimeCB.each_grp': ( 'api/callbacks.html#encodetimecb.each_grp',
                                                                                 'marisco/callbacks.py'),
+                                   'marisco.callbacks.FusedRemapCB': ('api/callbacks.html#fusedremapcb', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.FusedRemapCB.__call__': ( 'api/callbacks.html#fusedremapcb.__call__',
+                                                                                'marisco/callbacks.py'),
+                                   'marisco.callbacks.FusedRemapCB.__init__': ( 'api/callbacks.html#fusedremapcb.__init__',
+                                                                                'marisco/callbacks.py'),
+                                   'marisco.callbacks.FusedRemapCB._merge_grp': ( 'api/callbacks.html#fusedremapcb._merge_grp',
+                                                                                  'marisco/callbacks.py'),
+                                   'marisco.callbacks.FusedRemapCB.each_grp': ( 'api/callbacks.html#fusedremapcb.each_grp',
+                                                                                'marisco/callbacks.py'),
+                                   'marisco.callbacks.GrpDfs': ('api/callbacks.html#grpdfs', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.GrpDfs.__init__': ('api/callbacks.html#grpdfs.__init__', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.GrpView': ('api/callbacks.html#grpview', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.GrpView.__getattr__': ( 'api/callbacks.html#grpview.__getattr__',
+                                                                              'marisco/callbacks.py'),
+                                   'marisco.callbacks.GrpView.__init__': ('api/callbacks.html#grpview.__init__', 'marisco/callbacks.py'),
                                    'marisco.callbacks.LowerStripNameCB': ('api/callbacks.html#lowerstripnamecb', 'marisco/callbacks.py'),
                                    'marisco.callbacks.LowerStripNameCB.__init__': ( 'api/callbacks.html#lowerstripnamecb.__init__',
                                                                                     'marisco/callbacks.py'),
-                                   'marisco.callbacks.LowerStripNameCB._safe_transform': ( 'api/callbacks.html#lowerstripnamecb._safe_transform',
-                                                                                           'marisco/callbacks.py'),
+                                   'marisco.callbacks.LowerStripNameCB._map': ( 'api/callbacks.html#lowerstripnamecb._map',
+                                                                                'marisco/callbacks.py'),
                                    'marisco.callbacks.LowerStripNameCB.each_grp': ( 'api/callbacks.html#lowerstripnamecb.each_grp',
                                                                                     'marisco/callbacks.py'),
+                                   'marisco.callbacks.MeltPairsCB': ('api/callbacks.html#meltpairscb', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.MeltPairsCB.__call__': ( 'api/callbacks.html#meltpairscb.__call__',
+                                                                               'marisco/callbacks.py'),
+                                   'marisco.callbacks.MeltPairsCB.__init__': ( 'api/callbacks.html#meltpairscb.__init__',
+                                                                               'marisco/callbacks.py'),
+                                   'marisco.callbacks.MeltPairsCB._merge_grp': ( 'api/callbacks.html#meltpairscb._merge_grp',
+                                                                                 'marisco/callbacks.py'),
+                                   'marisco.callbacks.MeltPairsCB._stack': ( 'api/callbacks.html#meltpairscb._stack',
+                                                                             'marisco/callbacks.py'),
+                                   'marisco.callbacks.MeltPairsCB.each_grp': ( 'api/callbacks.html#meltpairscb.each_grp',
+                                                                               'marisco/callbacks.py'),
                                    'marisco.callbacks.MeltWideNuclidesCB': ( 'api/callbacks.html#meltwidenuclidescb',
                                                                              'marisco/callbacks.py'),
-                                   'marisco.callbacks.MeltWideNuclidesCB.__call__': ( 'api/callbacks.html#meltwidenuclidescb.__call__',
-                                                                                      'marisco/callbacks.py'),
                                    'marisco.callbacks.MeltWideNuclidesCB.__init__': ( 'api/callbacks.html#meltwidenuclidescb.__init__',
                                                                                       'marisco/callbacks.py'),
+                                   'marisco.callbacks.MemoryBudgetCB': ('api/callbacks.html#memorybudgetcb', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.MemoryBudgetCB.__call__': ( 'api/callbacks.html#memorybudgetcb.__call__',
+                                                                                  'marisco/callbacks.py'),
+                                   'marisco.callbacks.MemoryBudgetCB.__init__': ( 'api/callbacks.html#memorybudgetcb.__init__',
+                                                                                  'marisco/callbacks.py'),
+                                   'marisco.callbacks.MemoryBudgetCB._shrink': ( 'api/callbacks.html#memorybudgetcb._shrink',
+                                                                                 'marisco/callbacks.py'),
                                    'marisco.callbacks.ParseTimeCB': ('api/callbacks.html#parsetimecb', 'marisco/callbacks.py'),
                                    'marisco.callbacks.ParseTimeCB.__init__': ( 'api/callbacks.html#parsetimecb.__init__',
                                                                                'marisco/callbacks.py'),
@@ -61,14 +120,52 @@ d = { 'settings': { 'branch': 'main',
                                                                               'marisco/callbacks.py'),
                                    'marisco.callbacks.PerGroupCB.__init__': ( 'api/callbacks.html#pergroupcb.__init__',
                                                                               'marisco/callbacks.py'),
+                                   'marisco.callbacks.PerGroupCB._merge_grp': ( 'api/callbacks.html#pergroupcb._merge_grp',
+                                                                                'marisco/callbacks.py'),
                                    'marisco.callbacks.PerGroupCB.each_grp': ( 'api/callbacks.html#pergroupcb.each_grp',
                                                                               'marisco/callbacks.py'),
+                                   'marisco.callbacks.Profiler': ('api/callbacks.html#profiler', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.Profiler.__getstate__': ( 'api/callbacks.html#profiler.__getstate__',
+                                                                                'marisco/callbacks.py'),
+                                   'marisco.callbacks.Profiler.__init__': ('api/callbacks.html#profiler.__init__', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.Profiler.__setstate__': ( 'api/callbacks.html#profiler.__setstate__',
+                                                                                'marisco/callbacks.py'),
+                                   'marisco.callbacks.Profiler.fork': ('api/callbacks.html#profiler.fork', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.Profiler.record': ('api/callbacks.html#profiler.record', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.Profiler.start': ('api/callbacks.html#profiler.start', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.Profiler.stop': ('api/callbacks.html#profiler.stop', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.Profiler.to_df': ('api/callbacks.html#profiler.to_df', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.Profiler.to_json': ('api/callbacks.html#profiler.to_json', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.Profiler.to_trace': ('api/callbacks.html#profiler.to_trace', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.PruneColsCB': ('api/callbacks.html#prunecolscb', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.PruneColsCB.__call__': ( 'api/callbacks.html#prunecolscb.__call__',
+                                                                               'marisco/callbacks.py'),
+                                   'marisco.callbacks.PruneColsCB.__init__': ( 'api/callbacks.html#prunecolscb.__init__',
+                                                                               'marisco/callbacks.py'),
                                    'marisco.callbacks.RemapCB': ('api/callbacks.html#remapcb', 'marisco/callbacks.py'),
                                    'marisco.callbacks.RemapCB.__call__': ('api/callbacks.html#remapcb.__call__', 'marisco/callbacks.py'),
                                    'marisco.callbacks.RemapCB.__init__': ('api/callbacks.html#remapcb.__init__', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.RemapCB._dense_lut': ( 'api/callbacks.html#remapcb._dense_lut',
+                                                                             'marisco/callbacks.py'),
+                                   'marisco.callbacks.RemapCB._lookup': ('api/callbacks.html#remapcb._lookup', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.RemapCB._map': ('api/callbacks.html#remapcb._map', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.RemapCB._merge_grp': ( 'api/callbacks.html#remapcb._merge_grp',
+                                                                             'marisco/callbacks.py'),
+                                   'marisco.callbacks.RemapCB._prepare': ('api/callbacks.html#remapcb._prepare', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.RemapCB._remap_arrow': ( 'api/callbacks.html#remapcb._remap_arrow',
+                                                                               'marisco/callbacks.py'),
+                                   'marisco.callbacks.RemapCB._remap_categorical': ( 'api/callbacks.html#remapcb._remap_categorical',
+                                                                                     'marisco/callbacks.py'),
+                                   'marisco.callbacks.RemapCB._remap_dense': ( 'api/callbacks.html#remapcb._remap_dense',
+                                                                               'marisco/callbacks.py'),
+                                   'marisco.callbacks.RemapCB._remap_factorize': ( 'api/callbacks.html#remapcb._remap_factorize',
+                                                                                   'marisco/callbacks.py'),
+                                   'marisco.callbacks.RemapCB._report': ('api/callbacks.html#remapcb._report', 'marisco/callbacks.py'),
                                    'marisco.callbacks.RemapCB._resolve_lut': ( 'api/callbacks.html#remapcb._resolve_lut',
                                                                                'marisco/callbacks.py'),
                                    'marisco.callbacks.RemapCB.each_grp': ('api/callbacks.html#remapcb.each_grp', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.RemapCB.row_local': ('api/callbacks.html#remapcb.row_local', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.RemapCB.strategy': ('api/callbacks.html#remapcb.strategy', 'marisco/callbacks.py'),
                                    'marisco.callbacks.RemoveAllNAValuesCB': ( 'api/callbacks.html#removeallnavaluescb',
                                                                               'marisco/callbacks.py'),
                                    'marisco.callbacks.RemoveAllNAValuesCB.__call__': ( 'api/callbacks.html#removeallnavaluescb.__call__',
@@ -90,8 +187,18 @@ d = { 'settings': { 'branch': 'main',
                                                                                'marisco/callbacks.py'),
                                    'marisco.callbacks.Transformer.__init__': ( 'api/callbacks.html#transformer.__init__',
                                                                                'marisco/callbacks.py'),
+                                   'marisco.callbacks.Transformer._mk_pool': ( 'api/callbacks.html#transformer._mk_pool',
+                                                                               'marisco/callbacks.py'),
+                                   'marisco.callbacks.Transformer._peek_chunks': ( 'api/callbacks.html#transformer._peek_chunks',
+                                                                                   'marisco/callbacks.py'),
                                    'marisco.callbacks.Transformer._prepare_data': ( 'api/callbacks.html#transformer._prepare_data',
                                                                                     'marisco/callbacks.py'),
+                                   'marisco.callbacks.Transformer._profile_run': ( 'api/callbacks.html#transformer._profile_run',
+                                                                                   'marisco/callbacks.py'),
+                                   'marisco.callbacks.Transformer._to_backend': ( 'api/callbacks.html#transformer._to_backend',
+                                                                                  'marisco/callbacks.py'),
+                                   'marisco.callbacks.Transformer.explain': ( 'api/callbacks.html#transformer.explain',
+                                                                              'marisco/callbacks.py'),
                                    'marisco.callbacks.Transformer.unique': ( 'api/callbacks.html#transformer.unique',
                                                                              'marisco/callbacks.py'),
                                    'marisco.callbacks.UniqueIndexCB': ('api/callbacks.html#uniqueindexcb', 'marisco/callbacks.py'),
@@ -99,7 +206,59 @@ d = { 'settings': { 'branch': 'main',
                                                                                  'marisco/callbacks.py'),
                                    'marisco.callbacks.UniqueIndexCB.each_grp': ( 'api/callbacks.html#uniqueindexcb.each_grp',
                                                                                  'marisco/callbacks.py'),
-                                   'marisco.callbacks.run_cbs': ('api/callbacks.html#run_cbs', 'marisco/callbacks.py')},
+                                   'marisco.callbacks._all_cols': ('api/callbacks.html#_all_cols', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._categorize': ('api/callbacks.html#_categorize', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._commutes': ('api/callbacks.html#_commutes', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._downcast': ('api/callbacks.html#_downcast', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._each_grp': ('api/callbacks.html#_each_grp', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._fp': ('api/callbacks.html#_fp', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._global_names': ('api/callbacks.html#_global_names', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._init_args': ('api/callbacks.html#_init_args', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._invalidate': ('api/callbacks.html#_invalidate', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._is_filter': ('api/callbacks.html#_is_filter', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._lineage': ('api/callbacks.html#_lineage', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._lower_strip_strs': ('api/callbacks.html#_lower_strip_strs', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._merge_writes': ('api/callbacks.html#_merge_writes', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._mk_view': ('api/callbacks.html#_mk_view', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._n_data': ('api/callbacks.html#_n_data', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._n_rows': ('api/callbacks.html#_n_rows', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._recode_categorical': ( 'api/callbacks.html#_recode_categorical',
+                                                                              'marisco/callbacks.py'),
+                                   'marisco.callbacks._run_chunked': ('api/callbacks.html#_run_chunked', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._run_grp_state': ('api/callbacks.html#_run_grp_state', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._set_data': ('api/callbacks.html#_set_data', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._shape': ('api/callbacks.html#_shape', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._src_rows': ('api/callbacks.html#_src_rows', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._stack_take': ('api/callbacks.html#_stack_take', 'marisco/callbacks.py'),
+                                   'marisco.callbacks._sync_lineage': ('api/callbacks.html#_sync_lineage', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.cb_deps': ('api/callbacks.html#cb_deps', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.cb_waves': ('api/callbacks.html#cb_waves', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.check_reads': ('api/callbacks.html#check_reads', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.cow_mode': ('api/callbacks.html#cow_mode', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.fingerprint': ('api/callbacks.html#fingerprint', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.from_arrow': ('api/callbacks.html#from_arrow', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.from_categorical': ('api/callbacks.html#from_categorical', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.fuse_cbs': ('api/callbacks.html#fuse_cbs', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.is_arrow': ('api/callbacks.html#is_arrow', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.is_arrow_str': ('api/callbacks.html#is_arrow_str', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.is_barrier': ('api/callbacks.html#is_barrier', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.is_categorical': ('api/callbacks.html#is_categorical', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.iter_chunks': ('api/callbacks.html#iter_chunks', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.log_cb': ('api/callbacks.html#log_cb', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.lower_strip': ('api/callbacks.html#lower_strip', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.map_unique': ('api/callbacks.html#map_unique', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.parse_coords': ('api/callbacks.html#parse_coords', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.prune_cbs': ('api/callbacks.html#prune_cbs', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.push_filters': ('api/callbacks.html#push_filters', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.run_cb': ('api/callbacks.html#run_cb', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.run_cbs': ('api/callbacks.html#run_cbs', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.run_cbs_cached': ('api/callbacks.html#run_cbs_cached', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.run_cbs_chunked': ('api/callbacks.html#run_cbs_chunked', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.run_cbs_dag': ('api/callbacks.html#run_cbs_dag', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.run_grp': ('api/callbacks.html#run_grp', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.sample_groups': ('api/callbacks.html#sample_groups', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.to_arrow': ('api/callbacks.html#to_arrow', 'marisco/callbacks.py'),
+                                   'marisco.callbacks.to_categorical': ('api/callbacks.html#to_categorical', 'marisco/callbacks.py')},
             'marisco.cli.db_to_nc': { 'marisco.cli.db_to_nc.import_handler': ( 'cli/db_to_nc.html#import_handler',
                                                                                'marisco/cli/db_to_nc.py'),
                                       'marisco.cli.db_to_nc.main': ('cli/db_to_nc.html#main', 'marisco/cli/db_to_nc.py')},
@@ -111,13 +270,29 @@ d = { 'settings': { 'branch': 'main',
                                  'marisco.configs.Enums.__init__': ('api/configs.html#enums.__init__', 'marisco/configs.py'),
                                  'marisco.configs.Enums.filter': ('api/configs.html#enums.filter', 'marisco/configs.py'),
                                  'marisco.configs.Enums.lookup': ('api/configs.html#enums.lookup', 'marisco/configs.py'),
+                                 'marisco.configs.TemplateSchema': ('api/configs.html#templateschema', 'marisco/configs.py'),
+                                 'marisco.configs.TemplateSchema.__init__': ( 'api/configs.html#templateschema.__init__',
+                                                                              'marisco/configs.py'),
+                                 'marisco.configs.TemplateSchema.dims': ('api/configs.html#templateschema.dims', 'marisco/configs.py'),
+                                 'marisco.configs.TemplateSchema.from_json': ( 'api/configs.html#templateschema.from_json',
+                                                                               'marisco/configs.py'),
+                                 'marisco.configs.TemplateSchema.from_nc': ( 'api/configs.html#templateschema.from_nc',
+                                                                             'marisco/configs.py'),
+                                 'marisco.configs.TemplateSchema.time_units': ( 'api/configs.html#templateschema.time_units',
+                                                                                'marisco/configs.py'),
+                                 'marisco.configs.TemplateSchema.to_json': ( 'api/configs.html#templateschema.to_json',
+                                                                             'marisco/configs.py'),
+                                 'marisco.configs.TemplateSchema.vars': ('api/configs.html#templateschema.vars', 'marisco/configs.py'),
+                                 'marisco.configs._sanitize_strs': ('api/configs.html#_sanitize_strs', 'marisco/configs.py'),
                                  'marisco.configs.cache_path': ('api/configs.html#cache_path', 'marisco/configs.py'),
                                  'marisco.configs.get_lut': ('api/configs.html#get_lut', 'marisco/configs.py'),
                                  'marisco.configs.get_time_units': ('api/configs.html#get_time_units', 'marisco/configs.py'),
                                  'marisco.configs.lut_fname': ('api/configs.html#lut_fname', 'marisco/configs.py'),
                                  'marisco.configs.lut_path': ('api/configs.html#lut_path', 'marisco/configs.py'),
+                                 'marisco.configs.map_strs': ('api/configs.html#map_strs', 'marisco/configs.py'),
                                  'marisco.configs.nc_tpl_path': ('api/configs.html#nc_tpl_path', 'marisco/configs.py'),
                                  'marisco.configs.sanitize': ('api/configs.html#sanitize', 'marisco/configs.py'),
+                                 'marisco.configs.template_schema': ('api/configs.html#template_schema', 'marisco/configs.py'),
                                  'marisco.configs.try_int': ('api/configs.html#try_int', 'marisco/configs.py')},
             'marisco.decoders': { 'marisco.decoders.NetCDFDecoder': ('api/decoders.html#netcdfdecoder', 'marisco/decoders.py'),
                                   'marisco.decoders.NetCDFDecoder.__init__': ( 'api/decoders.html#netcdfdecoder.__init__',
@@ -135,6 +310,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                'marisco/encoders.py'),
                                   'marisco.encoders.NetCDFEncoder.all_cols': ( 'api/encoders.html#netcdfencoder.all_cols',
                                                                                'marisco/encoders.py'),
+                                  'marisco.encoders.NetCDFEncoder.cat_enum_values': ( 'api/encoders.html#netcdfencoder.cat_enum_values',
+                                                                                      'marisco/encoders.py'),
                                   'marisco.encoders.NetCDFEncoder.copy_dims': ( 'api/encoders.html#netcdfencoder.copy_dims',
                                                                                 'marisco/encoders.py'),
                                   'marisco.encoders.NetCDFEncoder.copy_global_attrs': ( 'api/encoders.html#netcdfencoder.copy_global_attrs',
@@ -244,7 +421,13 @@ d = { 'settings': { 'branch': 'main',
                                             'marisco.handlers.geotraces.encode': ( 'handlers/geotraces.html#encode',
                                                                                    'marisco/handlers/geotraces.py'),
                                             'marisco.handlers.geotraces.get_attrs': ( 'handlers/geotraces.html#get_attrs',
-                                                                                      'marisco/handlers/geotraces.py')},
+                                                                                      'marisco/handlers/geotraces.py'),
+                                            'marisco.handlers.geotraces.load_data': ( 'handlers/geotraces.html#load_data',
+                                                                                      'marisco/handlers/geotraces.py'),
+                                            'marisco.handlers.geotraces.lut_nuclides': ( 'handlers/geotraces.html#lut_nuclides',
+                                                                                         'marisco/handlers/geotraces.py'),
+                                            'marisco.handlers.geotraces.pipeline': ( 'handlers/geotraces.html#pipeline',
+                                                                                     'marisco/handlers/geotraces.py')},
             'marisco.handlers.helcom': { 'marisco.handlers.helcom.AddDepthCB': ( 'handlers/helcom.html#adddepthcb',
                                                                                  'marisco/handlers/helcom.py'),
                                          'marisco.handlers.helcom.AddDepthCB.each_grp': ( 'handlers/helcom.html#adddepthcb.each_grp',
@@ -331,7 +514,11 @@ d = { 'settings': { 'branch': 'main',
                                          'marisco.handlers.helcom.get_attrs': ( 'handlers/helcom.html#get_attrs',
                                                                                 'marisco/handlers/helcom.py'),
                                          'marisco.handlers.helcom.load_data': ( 'handlers/helcom.html#load_data',
-                                                                                'marisco/handlers/helcom.py')},
+                                                                                'marisco/handlers/helcom.py'),
+                                         'marisco.handlers.helcom.load_provider_lut': ( 'handlers/helcom.html#load_provider_lut',
+                                                                                        'marisco/handlers/helcom.py'),
+                                         'marisco.handlers.helcom.pipeline': ( 'handlers/helcom.html#pipeline',
+                                                                               'marisco/handlers/helcom.py')},
             'marisco.handlers.jois': { 'marisco.handlers.jois.ConvertU238CB': ( 'handlers/jois.html#convertu238cb',
                                                                                 'marisco/handlers/jois.py'),
                                        'marisco.handlers.jois.ConvertU238CB.each_grp': ( 'handlers/jois.html#convertu238cb.each_grp',
@@ -339,8 +526,6 @@ d = { 'settings': { 'branch': 'main',
                                        'marisco.handlers.jois.MeltJOISCB': ('handlers/jois.html#meltjoiscb', 'marisco/handlers/jois.py'),
                                        'marisco.handlers.jois.MeltJOISCB.__init__': ( 'handlers/jois.html#meltjoiscb.__init__',
                                                                                       'marisco/handlers/jois.py'),
-                                       'marisco.handlers.jois.MeltJOISCB.each_grp': ( 'handlers/jois.html#meltjoiscb.each_grp',
-                                                                                      'marisco/handlers/jois.py'),
                                        'marisco.handlers.jois.ParseDateTimeCB': ( 'handlers/jois.html#parsedatetimecb',
                                                                                   'marisco/handlers/jois.py'),
                                        'marisco.handlers.jois.ParseDateTimeCB.__init__': ( 'handlers/jois.html#parsedatetimecb.__init__',
@@ -362,7 +547,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                  'marisco/handlers/jois.py'),
                                        'marisco.handlers.jois.get_attrs': ('handlers/jois.html#get_attrs', 'marisco/handlers/jois.py'),
                                        'marisco.handlers.jois.load_data': ('handlers/jois.html#load_data', 'marisco/handlers/jois.py'),
-                                       'marisco.handlers.jois.norm_cols': ('handlers/jois.html#norm_cols', 'marisco/handlers/jois.py')},
+                                       'marisco.handlers.jois.norm_cols': ('handlers/jois.html#norm_cols', 'marisco/handlers/jois.py'),
+                                       'marisco.handlers.jois.pipeline': ('handlers/jois.html#pipeline', 'marisco/handlers/jois.py')},
             'marisco.handlers.maris_legacy': { 'marisco.handlers.maris_legacy.AddSampleIDCB': ( 'handlers/maris_legacy.html#addsampleidcb',
                                                                                                 'marisco/handlers/maris_legacy.py'),
                                                'marisco.handlers.maris_legacy.AddSampleIDCB.each_grp': ( 'handlers/maris_legacy.html#addsampleidcb.each_grp',
@@ -392,7 +578,9 @@ d = { 'settings': { 'branch': 'main',
                                                'marisco.handlers.maris_legacy.get_fname': ( 'handlers/maris_legacy.html#get_fname',
                                                                                             'marisco/handlers/maris_legacy.py'),
                                                'marisco.handlers.maris_legacy.get_zotero_key': ( 'handlers/maris_legacy.html#get_zotero_key',
-                                                                                                 'marisco/handlers/maris_legacy.py')},
+                                                                                                 'marisco/handlers/maris_legacy.py'),
+                                               'marisco.handlers.maris_legacy.iter_dump': ( 'handlers/maris_legacy.html#iter_dump',
+                                                                                            'marisco/handlers/maris_legacy.py')},
             'marisco.handlers.tepco': { 'marisco.handlers.tepco.AddSampleIdCB': ( 'handlers/tepco.html#addsampleidcb',
                                                                                   'marisco/handlers/tepco.py'),
                                         'marisco.handlers.tepco.AddSampleIdCB.__call__': ( 'handlers/tepco.html#addsampleidcb.__call__',
@@ -500,7 +688,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                            'marisco/handlers/tepco.py'),
                                         'marisco.handlers.tepco.get_locs_orbs': ( 'handlers/tepco.html#get_locs_orbs',
                                                                                   'marisco/handlers/tepco.py'),
-                                        'marisco.handlers.tepco.load_data': ('handlers/tepco.html#load_data', 'marisco/handlers/tepco.py')},
+                                        'marisco.handlers.tepco.load_data': ('handlers/tepco.html#load_data', 'marisco/handlers/tepco.py'),
+                                        'marisco.handlers.tepco.pipeline': ('handlers/tepco.html#pipeline', 'marisco/handlers/tepco.py')},
             'marisco.inout': { 'marisco.inout.flatten_dict': ('api/inout.html#flatten_dict', 'marisco/inout.py'),
                                'marisco.inout.read_toml': ('api/inout.html#read_toml', 'marisco/inout.py'),
                                'marisco.inout.write_toml': ('api/inout.html#write_toml', 'marisco/inout.py')},
@@ -509,6 +698,7 @@ d = { 'settings': { 'branch': 'main',
                                'marisco.match.lut_from': ('api/match.html#lut_from', 'marisco/match.py'),
                                'marisco.match.make_lut': ('api/match.html#make_lut', 'marisco/match.py'),
                                'marisco.match.make_lut_from': ('api/match.html#make_lut_from', 'marisco/match.py'),
+                               'marisco.match.provider_lut': ('api/match.html#provider_lut', 'marisco/match.py'),
                                'marisco.match.uniq_across_dfs': ('api/match.html#uniq_across_dfs', 'marisco/match.py')},
             'marisco.metadata': { 'marisco.metadata.BboxCB': ('api/metadata.html#bboxcb', 'marisco/metadata.py'),
                                   'marisco.metadata.BboxCB.__call__': ('api/metadata.html#bboxcb.__call__', 'marisco/metadata.py'),
@@ -575,4 +765,8 @@ d = { 'settings': { 'branch': 'main',
                                 'marisco.nc2csv.map_lut': ('api/nc2csv.html#map_lut', 'marisco/nc2csv.py'),
                                 'marisco.nc2csv.read_nc_grps': ('api/nc2csv.html#read_nc_grps', 'marisco/nc2csv.py'),
                                 'marisco.nc2csv.to_csv': ('api/nc2csv.html#to_csv', 'marisco/nc2csv.py'),
-                                'marisco.nc2csv.to_csv_files': ('api/nc2csv.html#to_csv_files', 'marisco/nc2csv.py')}}}
+                                'marisco.nc2csv.to_csv_files': ('api/nc2csv.html#to_csv_files', 'marisco/nc2csv.py')},
+            'marisco.timecodec': { 'marisco.timecodec._fast': ('api/timecodec.html#_fast', 'marisco/timecodec.py'),
+                                   'marisco.timecodec.decode_times': ('api/timecodec.html#decode_times', 'marisco/timecodec.py'),
+                                   'marisco.timecodec.encode_times': ('api/timecodec.html#encode_times', 'marisco/timecodec.py'),
+                                   'marisco.timecodec.parse_units': ('api/timecodec.html#parse_units', 'marisco/timecodec.py')}}}
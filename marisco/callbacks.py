@@ -6,25 +6,43 @@ Docs: https://franckalbinet.github.io/mariscoapi/callbacks.html.md"""
 
 # %% ../nbs/api/callbacks.ipynb #5a293345
 from __future__ import annotations
-import copy
+import copy, dis, functools, hashlib, itertools, json, os, pickle, shutil, tempfile, threading, time, tracemalloc, types, warnings
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
 from fastcore.all import *
 from operator import attrgetter
-from cftime import date2num ,num2date
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Callable, Any, Optional, Union
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import List, Dict, Callable, Any, Optional, Union, Iterable
 from collections import defaultdict
-from .configs import get_lut, get_time_units, NC_GROUPS, SMP_TYPE_LUT
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from .timecodec import encode_times, decode_times
+from .configs import get_lut, get_time_units, cache_path, map_strs, NC_DTYPES, NC_VARS, NC_GROUPS, SMP_TYPE_LUT, STR_KERNELS
 
 # %% auto #0
-__all__ = ['Callback', 'PerGroupCB', 'run_cbs', 'Transformer', 'SanitizeLonLatCB', 'RemapCB', 'LowerStripNameCB',
-           'AddSampleTypeIdColumnCB', 'RenameColumnsCB', 'RemoveAllNAValuesCB', 'MeltWideNuclidesCB', 'AddSampleIDCB',
-           'CompareDfsAndTfmCB', 'UniqueIndexCB', 'ParseTimeCB', 'EncodeTimeCB', 'DecodeTimeCB']
+__all__ = ['SAMPLE_KEYS', 'CAT_COLS', 'Callback', 'PerGroupCB', 'GrpView', 'run_grp', 'run_cbs', 'log_cb', 'run_cb', 'cow_mode',
+           'FusedRemapCB', 'fuse_cbs', 'push_filters', 'PruneColsCB', 'prune_cbs', 'DistinctIndex', 'GrpDfs',
+           'sample_groups', 'Transformer', 'is_barrier', 'cb_deps', 'cb_waves', 'check_reads', 'run_cbs_dag',
+           'Profiler', 'fingerprint', 'CheckpointCache', 'run_cbs_cached', 'is_arrow', 'is_arrow_str', 'to_arrow',
+           'from_arrow', 'is_categorical', 'to_categorical', 'from_categorical', 'parse_coords', 'SanitizeLonLatCB',
+           'map_unique', 'RemapCB', 'lower_strip', 'LowerStripNameCB', 'AddSampleTypeIdColumnCB', 'RenameColumnsCB',
+           'RemoveAllNAValuesCB', 'MeltPairsCB', 'MeltWideNuclidesCB', 'AddSampleIDCB', 'CompareDfsAndTfmCB',
+           'UniqueIndexCB', 'MemoryBudgetCB', 'ParseTimeCB', 'EncodeTimeCB', 'DecodeTimeCB', 'iter_chunks',
+           'run_cbs_chunked']
 
 # %% ../nbs/api/callbacks.ipynb #4e58c73c
 class Callback(): 
     "Base class for callbacks."
     order = 0
+    reads: list = None  # Columns read; None = undeclared
+    writes: list = None  # Columns written; None = undeclared
+    barrier: bool = False  # Drops, adds or reorders rows (or reshapes the frame)
+    row_local: bool = False  # Each output row depends only on its input row: can run chunk by chunk
+    fusable: bool = False  # Maps one column to another with `_map(s)`: can be fused (see `FusedRemapCB`)
+    filters: list = None  # Predicate columns of a row filter, which only drops rows (and may rewrite these columns)
+    observer: bool = False  # Only reports on the data (e.g. on the `Transformer`) without changing it: never checkpointed
     def __init__(self): pass
 
 # %% ../nbs/api/callbacks.ipynb #0414ac1d
@@ -38,8 +56,34 @@ class PerGroupCB(Callback):
         if grps is not None: self.grps = grps
 
     def __call__(self, tfm):
-        for grp in (self.grps or tfm.dfs):
-            if grp in tfm.dfs: self.each_grp(grp, tfm.dfs[grp], tfm)
+        grps = [grp for grp in (self.grps or tfm.dfs) if grp in tfm.dfs]
+        pool = getattr(tfm, 'pool', None)
+        if pool is None or len(grps) < 2:
+            for grp in grps: _each_grp(self, grp, tfm.dfs[grp], tfm)
+        else:
+            # Threads share `tfm` and the callback; processes receive copies of the callback and of the profiler
+            remote = not isinstance(pool, ThreadPoolExecutor)
+            prof = getattr(tfm, 'profiler', None) if remote else None
+            futs = [pool.submit(_run_grp_state, self, grp, tfm.dfs[grp], None if remote else tfm, prof and prof.fork())
+                    for grp in grps]
+            for grp, fut in zip(grps, futs):
+                tfm.dfs[grp], attrs, cb, records = fut.result()
+                # State set by `each_grp` is merged back in group order, as a sequential run leaves it
+                for k, v in attrs.items(): setattr(tfm, k, v)
+                if cb is not None: self._merge_grp(cb, grp)
+                if records: prof.records.extend(records)
+
+    def _merge_grp(self, 
+                   cb, # Copy of the callback that ran `each_grp` on `grp` in another process
+                   grp # Group it ran on
+                   ):
+        "Merge the state `cb` recorded for `grp` into this callback; override when `each_grp` records any."
+        pass
+
+def _each_grp(cb, grp, df, tfm):
+    prof = getattr(tfm, 'profiler', None)
+    if prof is None: return cb.each_grp(grp, df, tfm)
+    with prof.record(cb, tfm, grp): cb.each_grp(grp, df, tfm)
 
 # %% ../nbs/api/callbacks.ipynb #92cf2c26
 @patch
@@ -51,6 +95,68 @@ def each_grp(self:PerGroupCB,
     "Override to implement per-group transformation logic."
     raise NotImplementedError
 
+# %% ../nbs/api/callbacks.ipynb #d1f2afb0
+class GrpView():
+    "Stand-in for a `Transformer` holding its own `dfs`/`df`; other attributes are looked up on `parent`."
+    chunk: int = None # Position of the chunk it holds in a chunked run (see `run_cbs_chunked`)
+    lineage: dict = None # Source rows are only followed on the `Transformer` (see `run_cb`)
+    def __init__(self,
+                 dfs: Dict[str, pd.DataFrame]=None, # Group DataFrames seen by the callback
+                 parent=None,                       # Parent `Transformer`; None when running in another process
+                 df: pd.DataFrame=None,             # Single DataFrame (pre-split handlers)
+                 ):
+        self.dfs,self.df,self.parent = dfs,df,parent
+        self.distinct = DistinctIndex(self)
+
+    def __getattr__(self, k):
+        if k == 'parent' or self.parent is None: raise AttributeError(k)
+        return getattr(self.parent, k)
+
+# %% ../nbs/api/callbacks.ipynb #9378fd72
+def run_grp(
+    cb: PerGroupCB,    # Callback whose `each_grp` is run
+    grp: str,          # Group key
+    df: pd.DataFrame,  # DataFrame for this group
+    parent=None,       # Parent `Transformer`, if reachable from the worker
+    ) -> pd.DataFrame: # Transformed DataFrame for `grp`
+    "Run `cb.each_grp` on a single group in isolation and return the resulting DataFrame."
+    return _run_grp_state(cb, grp, df, parent)[0]
+
+def _run_grp_state(cb, grp, df, parent=None, profiler=None):
+    "`run_grp`, also returning the attributes `each_grp` set on its view and, away from `parent`, the callback and the spans of `profiler`."
+    view = GrpView({grp: df}, parent)
+    if profiler is not None: view.profiler = profiler
+    _each_grp(cb, grp, df, view)
+    attrs = {k: v for k, v in vars(view).items() if k not in ('dfs', 'df', 'parent', 'distinct', 'profiler')}
+    return view.dfs[grp], attrs, None if parent is not None else cb, None if profiler is None else profiler.records
+
+# %% ../nbs/api/callbacks.ipynb #0645c518
+def _src_rows(n): return np.arange(n, dtype=np.int32 if n < 2**31 else np.int64)
+
+def _lineage(obj):
+    "Index of each group of `obj`, to follow its rows through a callback; None when they aren't tracked."
+    if getattr(obj, 'lineage', None) is None: return None
+    return {grp: df.index for grp, df in ({None: obj.df} if obj.dfs is None else obj.dfs).items()}
+
+def _sync_lineage(obj, before, cb=None):
+    "Update `obj.lineage` to the rows of each group after `cb`, from their index labels in `before` or the positions `cb` reported."
+    dfs, lineage, src_pos = {None: obj.df} if obj.dfs is None else obj.dfs, obj.lineage, getattr(cb, 'src_pos', None) or {}
+    for grp in [g for g in lineage if g not in dfs]: del lineage[grp]
+    for grp, df in dfs.items():
+        idx, rows, pos = before.get(grp), lineage.get(grp), src_pos.pop(grp, None)
+        if idx is None or rows is None: lineage[grp] = np.full(len(df), -1, dtype=np.int64); continue
+        if pos is not None: lineage[grp] = rows[pos]; continue
+        if df.index is idx or df.index.equals(idx): continue
+        pos = idx.get_indexer(df.index) if idx.is_unique else np.full(len(df), -1)
+        if (pos >= 0).all(): lineage[grp] = rows[pos]
+        # Rows renumbered (e.g. `reset_index`); those added without a source row
+        elif len(df) == len(rows): continue
+        elif (pos >= 0).any() and not isinstance(df.index, pd.RangeIndex): lineage[grp] = np.where(pos >= 0, rows[pos], -1)
+        else:
+            by = '' if cb is None else f' by {type(cb).__name__}'
+            warnings.warn(f'Source rows of the "{grp}" group are lost (rows renumbered{by} without reporting `src_pos`).')
+            lineage[grp] = np.full(len(df), -1, dtype=np.int64)
+
 # %% ../nbs/api/callbacks.ipynb #61702d17
 def run_cbs(
     cbs: List[Callback], # List of callbacks to run
@@ -58,131 +164,967 @@ def run_cbs(
     ):
     "Run the callbacks in the order they are specified."
     for cb in sorted(cbs, key=attrgetter('order')):
-        if cb.__doc__: obj.logs.append(cb.__doc__)
-        cb(obj)
+        log_cb(cb, obj)
+        run_cb(cb, obj)
+
+def log_cb(cb: Callback, obj: Any):
+    "Append the docstring(s) of `cb` to `obj.logs`; a fused callback logs those of the callbacks it runs."
+    obj.logs.extend(doc for doc in getattr(cb, 'docs', [cb.__doc__]) if doc)
+
+def run_cb(cb: Callback, obj: Any):
+    "Run `cb` on `obj`, recording a span when `obj` has a `profiler` and keeping its row lineage (if tracked) and categorical columns in sync, and counting the rows a row filter drops."
+    prof, lineage = getattr(obj, 'profiler', None), _lineage(obj)
+    drops = getattr(obj, 'rows_dropped', None) if cb.filters is not None else None
+    if drops is not None: n = _n_rows(obj)
+    if prof is None: cb(obj)
+    else:
+        with prof.record(cb, obj): cb(obj)
+    if drops is not None: drops[cb] = drops.get(cb, 0) + n - _n_rows(obj)
+    if lineage is not None: _sync_lineage(obj, lineage, cb)
+    cat_cols = getattr(obj, 'cat_cols', None)
+    if cat_cols: _categorize(obj, cat_cols if cb.barrier or cb.writes is None else [c for c in cb.writes if c in cat_cols])
+    # Row drops and undeclared writes may change any column
+    _invalidate(obj, None if cb.barrier or cb.writes is None else cb.writes)
+
+def _n_rows(obj): return len(obj.df) if obj.dfs is None else sum(map(len, obj.dfs.values()))
+
+def _invalidate(obj, cols=None):
+    idx = getattr(obj, 'distinct', None)
+    if idx is not None: idx.invalidate(cols)
+
+# %% ../nbs/api/callbacks.ipynb #acbb4d80
+def cow_mode(
+    on: bool=True # Whether to enable copy-on-write; False = leave pandas settings untouched
+    ):
+    "Context manager enabling pandas copy-on-write (always on from pandas 3)."
+    if not on or int(pd.__version__.split('.')[0]) >= 3: return nullcontext()
+    return pd.option_context('mode.copy_on_write', True)
+
+# %% ../nbs/api/callbacks.ipynb #a41e9b7c
+class FusedRemapCB(PerGroupCB):
+    "Run a chain of fusable callbacks (e.g. `RemapCB`, `LowerStripNameCB`) in a single pass per column, on its unique values only."
+    def __init__(self, 
+                 cbs: List[Callback] # Chain of fusable callbacks, each reading and writing one column, in run order
+                 ):
+        store_attr()
+        self.order,self.__doc__,self.docs = cbs[0].order,None,[cb.__doc__ for cb in cbs]
+        self.reads = list(dict.fromkeys(c for i, cb in enumerate(cbs) for c in cb.reads if not any(c in prev.writes for prev in cbs[:i])))
+        self.writes = list(dict.fromkeys(c for cb in cbs for c in cb.writes))
+        self.grps = None if any(cb.grps is None for cb in cbs) else list(dict.fromkeys(g for cb in cbs for g in cb.grps))
+        self.row_local = all(cb.row_local for cb in cbs)
+
+    def __call__(self, tfm):
+        for cb in self.cbs:
+            if hasattr(cb, '_prepare'): cb._prepare(tfm)
+        super().__call__(tfm)
+        tfm.distinct.invalidate(self.writes)
+
+    def _merge_grp(self, cb, grp):
+        for own, copy in zip(self.cbs, cb.cbs): own._merge_grp(copy, grp)
+
+    def each_grp(self, grp, df, tfm):
+        cols,written = {},set() # Column -> (codes, value of each code)
+        for cb in self.cbs:
+            if cb.grps is not None and grp not in cb.grps: continue
+            (src,),(dst,) = cb.reads,cb.writes
+            # Source columns are factorized once across groups, and shared with the LUTs built from them
+            if src not in cols: codes, uniq = tfm.distinct.factorize(src); cols[src] = codes[grp], uniq
+            codes, uniq = cols[src]
+            if hasattr(cb, '_lookup'):
+                vals, hit = cb._lookup(pd.Series(uniq))
+                cb._report(grp, int((~hit[codes]).sum()))
+            elif src not in written and len({type(v) for v in uniq if pd.notna(v)}) > 1:
+                # `1`, `1.0` and `True` share a code but not a string: map the rows of a mixed-type column
+                codes, vals = pd.factorize(cb._map(df[src]), use_na_sentinel=False)
+            else: vals = cb._map(pd.Series(uniq))
+            cols[dst] = codes, pd.Series(vals).array
+            written.add(dst)
+        for col in self.writes:
+            if col in cols: df[col] = cols[col][1].take(cols[col][0])
+
+# %% ../nbs/api/callbacks.ipynb #85892bfe
+def fuse_cbs(
+    cbs: List[Callback] # Callbacks to run
+    ) -> List[Callback]: # Same callbacks, sorted, with runs of remaps fused
+    "Replace each run of consecutive fusable callbacks by a `FusedRemapCB`."
+    runs = []
+    for cb in sorted(cbs, key=attrgetter('order')):
+        # LUTs built from the data must see the columns written before them
+        if cb.fusable and runs and isinstance(runs[-1], list) and not callable(getattr(cb, 'lut', None)): runs[-1].append(cb)
+        else: runs.append([cb] if cb.fusable else cb)
+    return [(FusedRemapCB(o) if len(o) > 1 else o[0]) if isinstance(o, list) else o for o in runs]
+
+# %% ../nbs/api/callbacks.ipynb #f1cb0f08
+def _is_filter(cb): return cb.filters is not None and cb.reads is not None and cb.writes is not None and cb.row_local
+
+def _commutes(prev, cb):
+    "Whether row filter `cb` can run before `prev` with the same result."
+    if prev.order != cb.order or prev.reads is None or prev.writes is None or not prev.row_local: return False
+    if prev.barrier and prev.filters is None: return False
+    return not (set(prev.writes) & set(cb.reads + cb.writes) or set(prev.reads) & set(cb.writes))
+
+def push_filters(
+    cbs: List[Callback] # Callbacks to run
+    ) -> tuple: # Sorted callbacks with the filters moved up, and `{filter: callbacks it now precedes}`
+    "Move each row filter (`Callback.filters`) before the preceding callbacks it commutes with."
+    cbs, moves = sorted(cbs, key=attrgetter('order')), {}
+    for cb in list(cbs):
+        if not _is_filter(cb): continue
+        i = j = cbs.index(cb)
+        while i > 0 and _commutes(cbs[i - 1], cb): i -= 1
+        if i < j: moves[cb], cbs[i:j + 1] = cbs[i:j], [cb] + cbs[i:j]
+    return cbs, moves
+
+# %% ../nbs/api/callbacks.ipynb #538e8122
+class PruneColsCB(Callback):
+    "Drop the columns of each group that are not in `live`, recording the bytes they held in `freed`."
+    row_local = True
+    def __init__(self, 
+                 live: list,           # Columns read by a later callback or kept for encoding
+                 after: Callback=None, # Callback it follows; None = runs first
+                 ):
+        self.live,self.after,self.freed = live,None if after is None else type(after).__name__,{}
+        self.order = 0 if after is None else after.order
+        self.__doc__,self.docs,self.reads,self.writes = None,[],[],[]
+
+    def __call__(self, tfm):
+        live, dfs, dead = set(self.live), ({None: tfm.df} if tfm.dfs is None else tfm.dfs), set()
+        for grp, df in list(dfs.items()):
+            cols = [c for c in df.columns if c not in live]
+            if not cols: continue
+            for c in cols: self.freed[(grp, c)] = self.freed.get((grp, c), 0) + int(df[c].memory_usage(deep=True, index=False))
+            if tfm.dfs is None: tfm.df = df.drop(columns=cols)
+            else: tfm.dfs[grp] = df.drop(columns=cols)
+            dead.update(cols)
+        _invalidate(tfm, list(dead))
+
+def prune_cbs(
+    cbs: List[Callback], # Callbacks to run
+    keep: list=None,     # Columns kept to the end; None = `NC_VARS` columns
+    ) -> List[Callback]: # Same callbacks, sorted, with a `PruneColsCB` wherever columns stop being read
+    "Drop the columns no later callback reads as soon as the last callback reading them has run."
+    cbs = sorted(cbs, key=attrgetter('order'))
+    out, live = [], set(NC_VARS if keep is None else keep)
+    for cb in reversed(cbs):
+        undeclared = cb.reads is None or cb.writes is None
+        if live is not None and (undeclared or cb.barrier or not set(cb.reads + cb.writes) <= live): 
+            out.append(PruneColsCB(sorted(live), cb))
+        out.append(cb)
+        # Columns read before an undeclared callback are unknown
+        live = None if live is None or cb.reads is None else live | set(cb.reads)
+    if cbs and live is not None:
+        first = PruneColsCB(sorted(live))
+        first.order = cbs[0].order
+        out.append(first)
+    return out[::-1]
+
+# %% ../nbs/api/callbacks.ipynb #09a405fa
+class DistinctIndex():
+    "Distinct values of the columns of `obj` across groups, factorized on first use and kept until the column is written."
+    def __init__(self, 
+                 obj: Any # `Transformer` (or view) holding `df` or `dfs`
+                 ): 
+        self.obj,self._cols,self.n_built = obj,{},0
+
+    def factorize(self, col: str) -> tuple: # ({grp: codes}, distinct values indexed by the codes)
+        "Codes of `col` in each group holding it, and the distinct values (missing values included) they index."
+        if col not in self._cols:
+            dfs = {None: self.obj.df} if self.obj.dfs is None else self.obj.dfs
+            cols = {grp: df[col] for grp, df in dfs.items() if col in df.columns}
+            codes, uniq = pd.factorize(pd.concat(list(cols.values()) or [pd.Series(dtype=object)], ignore_index=True), use_na_sentinel=False)
+            self._cols[col] = dict(zip(cols, np.split(codes, np.cumsum([len(s) for s in cols.values()])[:-1]))), uniq
+            self.n_built += 1
+        return self._cols[col]
+
+    def unique(self, col: str) -> np.ndarray:
+        "Sorted distinct non-missing values of `col`."
+        uniq = self.factorize(col)[1]
+        return np.unique(np.asarray(uniq[pd.notna(uniq)]))
+
+    def value_counts(self, col: str) -> pd.Series:
+        "Number of rows holding each distinct non-missing value of `col`, most frequent first."
+        codes, uniq = self.factorize(col)
+        counts = np.bincount(np.concatenate([np.empty(0, dtype=np.intp), *codes.values()]), minlength=len(uniq))
+        return pd.Series(counts, index=uniq, name='count')[pd.notna(uniq)].sort_values(ascending=False, kind='stable')
+
+    def invalidate(self, 
+                   cols: list=None # Columns to drop; None = all
+                   ):
+        "Drop the cached entries of `cols`."
+        if cols is None: self._cols.clear()
+        else: 
+            for col in cols: self._cols.pop(col, None)
+
+class GrpDfs(dict):
+    "`{grp: DataFrame}` dict carrying the `DistinctIndex` of its data, as passed to LUTs built from the data."
+    def __init__(self, dfs, distinct): super().__init__(dfs); self.distinct = distinct
+
+# %% ../nbs/api/callbacks.ipynb #21aa8353
+SAMPLE_KEYS = ['NUCLIDE', 'UNIT', 'SPECIES', 'BODY_PART', 'SED_TYPE', 'FILT'] # Strata of `Transformer(sample=True)`
+
+def sample_groups(
+    data: Union[Dict[str, pd.DataFrame], pd.DataFrame], # Group DataFrames, or a single DataFrame
+    frac: float=0.,                                      # Fraction of the rows of each group to keep
+    by: list=None,                                       # Stratify by each of these columns (a list of columns: by their combinations)
+    n_min: int=1,                                        # Rows to keep of each stratum (of each non-empty group without `by` columns)
+    seed: int=0,                                         # Random seed
+    ) -> Union[Dict[str, pd.DataFrame], pd.DataFrame]:  # Sample of each group, rows in their original order
+    "Random `frac` of the rows of each group, plus at least `n_min` rows of each distinct value of each `by` key."
+    rng = np.random.default_rng(seed)
+    def _take(pos, n): return rng.choice(pos, min(len(pos), n), replace=False)
+    def _sample(df):
+        if not len(df): return df
+        keys = [k for k in listify(by) if all(c in df.columns for c in listify(k))]
+        strata = [pos for k in keys for pos in df.groupby(k, dropna=False, sort=False, observed=True).indices.values()]
+        n = round(frac * len(df))
+        pos = [_take(np.arange(len(df)), n if strata else max(n, n_min))] + [_take(p, n_min) for p in strata]
+        return df.iloc[np.unique(np.concatenate(pos))]
+    return _sample(data) if isinstance(data, pd.DataFrame) else {grp: _sample(df) for grp, df in data.items()}
 
 # %% ../nbs/api/callbacks.ipynb #82a6611d
 class Transformer():
     "Transform the dataframe(s) according to the specified callbacks."
     def __init__(self, 
-                 data: Union[Dict[str, pd.DataFrame], pd.DataFrame], # Data to be transformed
+                 data: Union[Dict[str, pd.DataFrame], pd.DataFrame, Iterable], # Data to be transformed, or an iterable of chunks of it
                  cbs: Optional[List[Callback]]=None, # List of callbacks to run
                  custom_maps: Dict = None,
-                 inplace: bool=False # Whether to modify the dataframe(s) in place
+                 inplace: bool=False, # Whether to modify the dataframe(s) in place
+                 executor: str=None, # Run `PerGroupCB` groups on a `'threads'` or `'processes'` pool; None = sequential
+                 max_workers: int=None, # Pool size; None = executor default
+                 dag: bool=False, # Run independent callbacks concurrently based on their declared columns
+                 profile: bool=False, # Record per-callback/group timings, memory and shapes in `self.profiler`
+                 cow: bool=False, # Copy `data` lazily using pandas copy-on-write instead of deep-copying it
+                 cache: CheckpointCache|bool=None, # Checkpoint after each callback and resume reruns; True = default `CheckpointCache()`
+                 backend: str='numpy', # `'arrow'` converts string columns to `string[pyarrow]` (see `to_arrow`)
+                 categorical: bool|list=False, # Hold `CAT_COLS` (or these columns) as pandas Categoricals (see `to_categorical`)
+                 chunksize: int=None, # Run consecutive row-local callbacks over chunks of this many rows (see `run_cbs_chunked`)
+                 fuse: bool=False, # Fuse consecutive `RemapCB`/`LowerStripNameCB` into one pass per column (see `fuse_cbs`)
+                 pushdown: bool=False, # Run row filters as early as their columns allow (see `push_filters`)
+                 prune: bool|list=False, # Drop the columns no later callback reads, keeping `NC_VARS` (or these columns) (see `prune_cbs`)
+                 sample: bool|list=False, # Run on a stratified sample of `data`, by the `SAMPLE_KEYS` (or these) columns (see `sample_groups`)
+                 sample_min: int=1, # Rows of the sample for each distinct value of each stratification key
+                 track_rows: bool=False # Track the source row of each row in `self.lineage` (see `run_cb`)
                  ): 
         store_attr()
+        if executor not in (None, 'threads', 'processes'): raise ValueError(f"Unknown executor: {executor!r}")
+        if backend not in ('numpy', 'arrow'): raise ValueError(f"Unknown backend: {backend!r}")
+        self.chunks = None
+        self.cat_cols = CAT_COLS if categorical is True else list(categorical or [])
+        if not isinstance(data, (pd.DataFrame, dict)): data, self.chunks = self._peek_chunks(data)
+        if (self.chunks is not None or chunksize) and (cache or dag): raise ValueError("Chunked execution can't be combined with `cache` or `dag`")
+        if prune and dag: raise ValueError("Column pruning can't be combined with `dag`")
+        if self.chunks is not None and track_rows: raise ValueError("Source rows of a chunk stream can't be tracked")
+        if track_rows and cache: raise ValueError("Source rows can't be tracked through checkpoints")
+        if sample and self.chunks is not None: raise ValueError("A chunk stream can't be sampled")
+        if sample: data = sample_groups(data, by=SAMPLE_KEYS if sample is True else sample, n_min=sample_min)
         self.is_single_df = isinstance(data, pd.DataFrame)
-        self.df, self.dfs = self._prepare_data(data, inplace)
+        with cow_mode(cow): self.df, self.dfs = self._prepare_data(data, inplace)
+        if backend == 'arrow' or self.cat_cols:
+            if self.dfs is None: self.df = self._to_backend(self.df)
+            else: self.dfs.update(self._to_backend(self.dfs))
         self.logs = []
-        self.custom_maps = custom_maps or defaultdict(lambda: defaultdict(dict))
+        self.custom_maps = custom_maps or defaultdict(functools.partial(defaultdict, dict))
+        self.pool = None
+        self.profiler = Profiler() if profile else None
+        self.cache = CheckpointCache() if cache is True else cache or None
+        self.distinct = DistinctIndex(self)
+        self.rows_dropped,self.rows_saved,self.cols_pruned = {},None,None
+        self.n_src = {k: len(v) for k, v in ({None: self.df} if self.dfs is None else self.dfs).items()} if track_rows else {}
+        self.lineage = {k: _src_rows(n) for k, n in self.n_src.items()} if track_rows else None
             
     def _prepare_data(self, data, inplace):
         if self.is_single_df:
-            return (data if inplace else data.copy()), None
+            return (data if inplace else data.copy(deep=not self.cow)), None
         else:
-            return None, (data if inplace else {k: v.copy() for k, v in data.items()})
+            return None, (data if inplace else {k: v.copy(deep=not self.cow) for k, v in data.items()})
     
+    def _to_backend(self, data):
+        def _conv(df):
+            if self.backend == 'arrow': df = to_arrow(df)
+            return to_categorical(df, self.cat_cols) if self.cat_cols else df
+        return _conv(data) if isinstance(data, pd.DataFrame) else {k: _conv(v) for k, v in data.items()}
+
+    def _peek_chunks(self, chunks):
+        "Empty stand-in for the data of a chunk stream (telling single DataFrame from groups), and the stream itself."
+        it = iter(chunks)
+        first = next(it, {})
+        empty = first.iloc[:0] if isinstance(first, pd.DataFrame) else {}
+        return empty, map(self._to_backend, itertools.chain([first], it))
+
+    def _mk_pool(self):
+        if self.executor is None: return None
+        pool_cls = ThreadPoolExecutor if self.executor == 'threads' else ProcessPoolExecutor
+        return pool_cls(max_workers=self.max_workers)
+
     def unique(self, col_name: str) -> np.ndarray:
         "Distinct values of a specific column present in all groups."
-        if self.is_single_df:
-            values = self.df.get(col_name, pd.Series()).dropna().values
-        else:
-            columns = [df.get(col_name) for df in self.dfs.values() if df.get(col_name) is not None]
-            values = np.concatenate([col.dropna().values for col in columns]) if columns else []
-        return np.unique(values)
+        return self.distinct.unique(col_name)
         
     def __call__(self):
         "Transform the dataframe(s) according to the specified callbacks."
-        if self.cbs: run_cbs(self.cbs, self)
+        if self.cbs or self.chunks is not None:
+            self.pool = self._mk_pool()
+            if self.profiler is not None: self.profiler.start()
+            try:
+                cbs, moves = push_filters(self.cbs or []) if self.pushdown else (self.cbs or [], {})
+                if self.fuse: cbs = fuse_cbs(cbs)
+                if self.prune: cbs = prune_cbs(cbs, None if self.prune is True else self.prune)
+                with cow_mode(self.cow):
+                    if self.chunks is not None or self.chunksize:
+                        run_cbs_chunked(cbs, self, self.chunksize, self.chunks)
+                        self.chunks = None
+                    elif self.cache is not None: run_cbs_cached(cbs, self, self.cache)
+                    elif self.dag: run_cbs_dag(cbs, self, self.max_workers)
+                    else: run_cbs(cbs, self)
+            finally:
+                if self.pool is not None: self.pool.shutdown()
+                if self.profiler is not None: self.profiler.stop()
+                self.pool = None
+            pruned = [(grp, col, cb.after, n) for cb in cbs if isinstance(cb, PruneColsCB) for (grp, col), n in cb.freed.items()]
+            if self.prune: self.cols_pruned = pd.DataFrame(pruned, columns=['group', 'column', 'after', 'bytes'])
+            if moves:
+                # Logs describe the pipeline as written
+                logs = [doc for cb in sorted(self.cbs, key=attrgetter('order')) for doc in getattr(cb, 'docs', [cb.__doc__]) if doc]
+                self.logs[-len(logs):] = logs
+                self.rows_saved = pd.DataFrame([(type(f).__name__, type(cb).__name__, self.rows_dropped.get(f, 0)) 
+                                                for f, skipped in moves.items() for cb in skipped], columns=['filter', 'stage', 'rows_saved'])
+        # Chunks are concatenated with their own categories
+        if self.cat_cols: _categorize(self, self.cat_cols)
         return self.df if self.dfs is None else self.dfs
 
+# %% ../nbs/api/callbacks.ipynb #668bfd31
+def is_barrier(cb: Callback) -> bool:
+    "Whether `cb` must run alone: it declares itself a barrier or leaves its columns undeclared."
+    return cb.barrier or cb.reads is None or cb.writes is None
+
+# %% ../nbs/api/callbacks.ipynb #ed6f46c9
+def cb_deps(
+    cbs: List[Callback], # Callbacks in run order
+    ) -> List[set]:      # For each callback, indices of the earlier callbacks it depends on
+    "Dependency DAG of `cbs` derived from their declared `reads`/`writes`."
+    def _conflict(a, b): return bool(set(a.writes) & set(b.reads + b.writes) or set(a.reads) & set(b.writes))
+    return [{i for i, prev in enumerate(cbs[:j]) if is_barrier(prev) or is_barrier(cb) or _conflict(prev, cb)}
+            for j, cb in enumerate(cbs)]
+
+# %% ../nbs/api/callbacks.ipynb #636ac9af
+def cb_waves(
+    cbs: List[Callback],     # Callbacks in run order
+    ) -> List[List[Callback]]: # Waves of mutually independent callbacks
+    "Assign each callback to the first wave following all the callbacks it depends on."
+    lvls = []
+    for deps in cb_deps(cbs): lvls.append(1 + max((lvls[i] for i in deps), default=-1))
+    return [[cb for cb, l in zip(cbs, lvls) if l == w] for w in range(max(lvls, default=-1) + 1)]
+
+# %% ../nbs/api/callbacks.ipynb #6767c3ce
+def check_reads(
+    cbs: List[Callback], # Callbacks in run order
+    cols,                # Columns available before the first callback
+    ):
+    "Raise a `ValueError` listing declared reads that neither `cols` nor an earlier callback provides."
+    known, errs = set(cols), []
+    for cb in cbs:
+        # Past an undeclared callback the available columns are unknown
+        if cb.reads is None or cb.writes is None: break
+        missing = [c for c in cb.reads if c not in known]
+        if missing: errs.append(f"{type(cb).__name__} reads {missing}")
+        known |= set(cb.writes)
+    if errs: raise ValueError(f"Read before write: {'; '.join(errs)}")
+
+# %% ../nbs/api/callbacks.ipynb #1f078a81
+def _all_cols(obj): return obj.df.columns if obj.dfs is None else set().union(*(df.columns for df in obj.dfs.values()))
+
+def _mk_view(obj):
+    if obj.dfs is None: return GrpView(parent=obj, df=obj.df.copy(deep=False))
+    return GrpView({k: v.copy(deep=False) for k, v in obj.dfs.items()}, parent=obj)
+
+def _merge_writes(obj, view, cols):
+    pairs = [(obj.df, view.df)] if obj.dfs is None else [(obj.dfs[k], v) for k, v in view.dfs.items() if k in obj.dfs]
+    for dst, src in pairs:
+        for col in cols:
+            if col in src.columns: dst[col] = src[col].values
+    _invalidate(obj, cols)
+
+# %% ../nbs/api/callbacks.ipynb #4ecbcd5c
+def run_cbs_dag(
+    cbs: List[Callback],   # List of callbacks to run
+    obj: Any,              # Object to pass to the callbacks
+    max_workers: int=None, # Thread pool size; None = executor default
+    ):
+    "Run the callbacks wave by wave, running the independent callbacks of a wave concurrently."
+    cbs = sorted(cbs, key=attrgetter('order'))
+    check_reads(cbs, _all_cols(obj))
+    for cb in cbs:
+        log_cb(cb, obj)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for wave in cb_waves(cbs):
+            if len(wave) == 1: run_cb(wave[0], obj); continue
+            views = [_mk_view(obj) for _ in wave]
+            for fut in [pool.submit(run_cb, cb, view) for cb, view in zip(wave, views)]: fut.result()
+            for cb, view in zip(wave, views): _merge_writes(obj, view, cb.writes)
+
+# %% ../nbs/api/callbacks.ipynb #bd3fecc6
+def _shape(obj, grp=None):
+    "Row count and column set of `obj`, or of its `grp` group."
+    dfs = {None: obj.df} if obj.dfs is None else obj.dfs if grp is None else {grp: obj.dfs.get(grp)}
+    dfs = [df for df in dfs.values() if df is not None]
+    return sum(len(df) for df in dfs), set().union(*(df.columns for df in dfs))
+
+# %% ../nbs/api/callbacks.ipynb #fdc9d799
+class Profiler():
+    "Record wall time, CPU time, tracemalloc peak, rows in/out and columns added per callback and group."
+    def __init__(self, 
+                 memory: bool=True # Track tracemalloc peaks (slower); False = timings and shapes only
+                 ):
+        store_attr()
+        self.records,self._local,self._t0,self._own_trace,self._depth0 = [],threading.local(),time.perf_counter(),False,0
+        self._tid = threading.get_ident()
+
+    # Thread-local span stacks don't pickle, and are only alive while a callback runs
+    def __getstate__(self): return {k: v for k, v in vars(self).items() if k != '_local'}
+    def __setstate__(self, state): vars(self).update(state, _local=threading.local())
+
+    def fork(self) -> Profiler:
+        "Empty copy with the same clock origin, to record the spans of a worker process nested in the current span."
+        prof = copy.copy(self)
+        prof.records,prof._depth0 = [],self._depth0 + len(self._local.__dict__.get('stack', []))
+        return prof
+
+    def start(self):
+        "Start `tracemalloc` if memory tracking is on and nobody else is tracing."
+        self._tid = threading.get_ident()
+        if self.memory and not tracemalloc.is_tracing(): tracemalloc.start(); self._own_trace = True
+
+    def stop(self):
+        "Stop `tracemalloc` if it was started by `start`."
+        if self._own_trace: tracemalloc.stop(); self._own_trace = False
+
+    @contextmanager
+    def record(self, 
+               cb: Callback, # Callback being run
+               obj: Any,     # Object the callback is run on
+               grp: str=None # Group being processed; None = the whole callback
+               ):
+        "Context manager recording a span for `cb` (on `grp`) run on `obj`."
+        # `tracemalloc` peaks are process-wide: only spans run on the thread that started profiling get one
+        mem = tracemalloc.is_tracing() and threading.get_ident() == self._tid
+        stack = self._local.__dict__.setdefault('stack', [])
+        rows_in, cols_in = _shape(obj, grp)
+        frame = {'base': tracemalloc.get_traced_memory()[0], 'hi': 0} if mem else None
+        if mem:
+            if stack and stack[-1]: stack[-1]['hi'] = max(stack[-1]['hi'], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        stack.append(frame)
+        t, cpu = time.perf_counter(), time.thread_time()
+        try: yield
+        finally:
+            wall, cpu = time.perf_counter() - t, time.thread_time() - cpu
+            stack.pop()
+            peak = None
+            if mem:
+                hi = max(frame['hi'], tracemalloc.get_traced_memory()[1])
+                peak = hi - frame['base']
+                if stack and stack[-1]: stack[-1]['hi'] = max(stack[-1]['hi'], hi)
+            rows_out, cols_out = _shape(obj, grp)
+            self.records.append(dict(
+                name=type(cb).__name__, grp=grp, start=t - self._t0, wall=wall, cpu=cpu, mem_peak=peak,
+                rows_in=rows_in, rows_out=rows_out, cols_added=sorted(map(str, cols_out - cols_in)),
+                tid=threading.get_ident(), depth=self._depth0 + len(stack)))
+
+    def to_df(self) -> pd.DataFrame:
+        "Records as a DataFrame, one row per span."
+        return pd.DataFrame(self.records)
+
+    def to_json(self, 
+                fname: str=None # File to write; None = only return the string
+                ) -> str:
+        "Records as a JSON string, optionally written to `fname`."
+        s = json.dumps(self.records, indent=1)
+        if fname: Path(fname).write_text(s)
+        return s
+
+    def to_trace(self, 
+                 fname: str=None # File to write; None = only return the dict
+                 ) -> dict:
+        "Records in Chrome `trace_event` format (load in `chrome://tracing` or Perfetto), optionally written to `fname`."
+        evts = [{'name': r['name'] if r['grp'] is None else f"{r['name']} [{r['grp']}]",
+                 'cat': 'callback' if r['grp'] is None else 'group', 'ph': 'X', 'pid': os.getpid(), 'tid': r['tid'],
+                 'ts': r['start'] * 1e6, 'dur': r['wall'] * 1e6,
+                 'args': {k: r[k] for k in ('grp', 'cpu', 'mem_peak', 'rows_in', 'rows_out', 'cols_added')}}
+                for r in self.records]
+        trace = {'traceEvents': evts, 'displayTimeUnit': 'ms'}
+        if fname: Path(fname).write_text(json.dumps(trace))
+        return trace
+
+# %% ../nbs/api/callbacks.ipynb #eab8ced0
+def _n_data(data): return len(data) if isinstance(data, pd.DataFrame) else sum(map(len, data.values()))
+
+@patch
+def _profile_run(self:Transformer, data):
+    "Per-callback spans of a profiled run of copies of the callbacks on `data`."
+    tfm = Transformer(data, cbs=copy.deepcopy(self.cbs), custom_maps=copy.deepcopy(self.custom_maps), profile=True, 
+                      backend=self.backend, categorical=self.cat_cols, fuse=self.fuse, pushdown=self.pushdown, prune=self.prune)
+    tfm()
+    spans = tfm.profiler.to_df()
+    return spans[spans.grp.isna() & (spans.depth == 0)].reset_index(drop=True)
+
+@patch
+def explain(self:Transformer, 
+            sample_frac: float=0.01, # Fraction of the rows of each group to run the pipeline on
+            seed: int=0,             # Random seed of the sample
+            verbose: bool=True,      # Print the ranked estimates
+            ) -> pd.DataFrame:       # Estimates per callback, most expensive first
+    "Estimate the wall time, peak memory and output rows of each callback on the full data from runs on a sample."
+    if self.chunks is not None: raise ValueError("A chunk stream can't be sampled before it is run")
+    data = self.df if self.dfs is None else self.dfs
+    smp = sample_groups(data, sample_frac, seed=seed)
+    half = sample_groups(smp, 0.5, seed=seed)
+    # The smaller run goes first and absorbs warm-up costs (LUT loading, caches), which biases towards linear scaling
+    spans_half, spans = self._profile_run(half), self._profile_run(smp)
+    n, n_smp, n_half = _n_data(data), _n_data(smp), _n_data(half)
+    ratio = n / max(n_smp, 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = np.log(spans.wall / spans_half.wall) / np.log(n_smp / n_half) if n_smp > n_half else pd.Series(1., index=spans.index)
+    k = k.fillna(1.).clip(1, 2)
+    est = pd.DataFrame({'step': spans.index, 'callback': spans.name, 'sample_wall': spans.wall, 'scaling': k.round(2),
+                        'est_wall': spans.wall * ratio ** k, 'est_mem_peak': spans.mem_peak * ratio, 
+                        'est_rows_out': (spans.rows_out * ratio).round().astype(int)})
+    est = est.sort_values('est_wall', ascending=False, kind='stable').reset_index(drop=True)
+    if verbose:
+        print(f"Estimates for {n:,} rows from a sample of {n_smp:,} ({n_smp / max(n, 1):.2%}): "
+              f"{est.est_wall.sum():.1f} s, peak {est.est_mem_peak.max() / 2**20:.1f} MiB")
+        print(est.assign(est_wall=est.est_wall.map('{:.2f} s'.format), 
+                         est_mem_peak=(est.est_mem_peak / 2**20).map('{:.1f} MiB'.format)).drop(columns='sample_wall').to_string(index=False))
+    return est
+
+# %% ../nbs/api/callbacks.ipynb #e62a5999
+def _global_names(code):
+    "Names `code` (and the code nested in it) loads from its globals."
+    names = {i.argval for i in dis.get_instructions(code) if i.opname == 'LOAD_GLOBAL'}
+    return names.union(*(_global_names(c) for c in code.co_consts if isinstance(c, types.CodeType)))
+
+def _init_args(t):
+    "Constructor argument names of class `t` and its bases: the attributes `store_attr` sets."
+    return {n for c in t.__mro__ if isinstance(f := vars(c).get('__init__'), types.FunctionType)
+            for n in f.__code__.co_varnames[1:f.__code__.co_argcount + f.__code__.co_kwonlyargcount]}
+
+def _fp(o, h, depth=0, seen=None):
+    seen = {} if seen is None else seen
+    t = type(o)
+    h.update(f'{t.__module__}.{t.__qualname__}:'.encode())
+    if o is None or isinstance(o, (bool, int, float, complex, str, bytes, np.generic)): return h.update(repr(o).encode())
+    if depth > 8 or id(o) in seen: return h.update(b'...')
+    seen[id(o)] = o # Keeping `o` alive so that its id can't be reused by a temporary
+    rec = lambda x: _fp(x, h, depth + 1, seen)
+    if isinstance(o, (pd.DataFrame, pd.Series, pd.Index)):
+        h.update(repr((o.columns, o.dtypes) if isinstance(o, pd.DataFrame) else o.dtype).encode())
+        try: h.update(pd.util.hash_pandas_object(o).values.tobytes())
+        except TypeError: h.update(pickle.dumps(o))
+    elif isinstance(o, np.ndarray): h.update(str(o.dtype).encode()); h.update(pickle.dumps(o))
+    elif isinstance(o, dict):
+        for k in sorted(o, key=repr): rec(k); rec(o[k])
+    elif isinstance(o, (set, frozenset)): 
+        for x in sorted(o, key=repr): rec(x)
+    elif isinstance(o, (list, tuple)): 
+        for x in o: rec(x)
+    elif isinstance(o, types.CodeType): h.update(o.co_code); rec(o.co_consts); rec(o.co_names)
+    elif isinstance(o, types.FunctionType):
+        h.update(o.__qualname__.encode()); rec(o.__code__); rec(o.__defaults__); rec(o.__kwdefaults__)
+        rec([c.cell_contents for c in o.__closure__ or ()])
+        # Module-level values the function reads (e.g. a LUT dict) are part of its configuration
+        rec({k: o.__globals__[k] for k in _global_names(o.__code__)
+             if k in o.__globals__ and not isinstance(o.__globals__[k], (types.ModuleType, type))})
+    elif isinstance(o, functools.partial): rec(o.func); rec(o.args); rec(o.keywords)
+    elif isinstance(o, types.MethodType): rec(o.__func__); rec(o.__self__)
+    elif isinstance(o, type):
+        for c in o.__mro__[:-1]: h.update(c.__qualname__.encode()); rec({k: v for k, v in vars(c).items() if isinstance(v, types.FunctionType)})
+    elif hasattr(o, '__dict__'):
+        # Only the constructor arguments: other attributes may be run state (e.g. `RemapCB.n_unmapped`)
+        args = _init_args(t)
+        rec(t); rec({k: v for k, v in vars(o).items() if k in args} or {k: v for k, v in vars(o).items() if not k.startswith('_')})
+    else: h.update(repr(o).encode())
+
+def fingerprint(o) -> str:
+    "Stable hash of `o`: values, containers, DataFrames, functions (code, closure, globals read) and objects (class code, constructor arguments)."
+    h = hashlib.sha1()
+    _fp(o, h)
+    return h.hexdigest()
+
+# %% ../nbs/api/callbacks.ipynb #7dc844b5
+class CheckpointCache():
+    "Parquet checkpoints of `Transformer` data keyed by input and callback fingerprints, evicted by age and size."
+    def __init__(self, 
+                 path: str=None,             # Cache directory; None = `cache_path()/'checkpoints'`
+                 max_bytes: int=2**30,       # Evict least recently used checkpoints beyond this total size
+                 max_age: float=7*24*3600    # Evict checkpoints unused for longer than this (seconds)
+                 ):
+        store_attr()
+        self.path = Path(path) if path else cache_path() / 'checkpoints'
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def key(self, prev: str, cb: Callback) -> str:
+        "Key of the checkpoint taken after `cb`, given the key `prev` of its input."
+        return hashlib.sha1(f'{prev}:{fingerprint(cb)}'.encode()).hexdigest()
+
+    def has(self, key: str) -> bool:
+        "Whether a checkpoint is stored under `key`."
+        return (self.path / key / 'meta.json').exists()
+
+    def load(self, key: str):
+        "Cached DataFrame or dict of DataFrames for `key`, or None."
+        d = self.path / key
+        try:
+            meta = json.loads((d / 'meta.json').read_text())
+            data = {grp: pd.read_parquet(d / f'{i}.parquet') for i, grp in enumerate(meta['grps'])}
+        except (OSError, ValueError, pa.ArrowException): return None
+        os.utime(d / 'meta.json')
+        return data[None] if meta['single'] else data
+
+    def save(self, key: str, obj: Any):
+        "Checkpoint `obj.df`/`obj.dfs` under `key`; data Parquet can't store is silently not cached."
+        dfs = {None: obj.df} if obj.dfs is None else obj.dfs
+        d, tmp = self.path / key, self.path / f'.{key}.{os.getpid()}.{threading.get_ident()}'
+        try:
+            tmp.mkdir(parents=True, exist_ok=True)
+            for i, df in enumerate(dfs.values()): df.to_parquet(tmp / f'{i}.parquet')
+            (tmp / 'meta.json').write_text(json.dumps({'single': obj.dfs is None, 'grps': list(dfs)}))
+            if not d.exists(): tmp.rename(d)
+        except (OSError, ValueError, TypeError, pa.ArrowException): pass
+        finally: shutil.rmtree(tmp, ignore_errors=True)
+        self.evict()
+
+    def evict(self):
+        "Remove checkpoints older than `max_age`, then the least recently used ones until under `max_bytes`."
+        entries = []
+        for d in self.path.iterdir():
+            if d.name.startswith('.') or not (d / 'meta.json').exists(): continue
+            entries.append(((d / 'meta.json').stat().st_mtime, sum(f.stat().st_size for f in d.iterdir()), d))
+        entries.sort(key=lambda e: e[0])
+        total, now = sum(e[1] for e in entries), time.time()
+        for mtime, size, d in entries:
+            if now - mtime <= self.max_age and total <= self.max_bytes: break
+            shutil.rmtree(d, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        "Remove all checkpoints."
+        for d in self.path.iterdir(): shutil.rmtree(d, ignore_errors=True)
+
+# %% ../nbs/api/callbacks.ipynb #8bf78552
+def _set_data(obj, data):
+    if obj.dfs is None: obj.df = data
+    else: obj.dfs = data
+    _invalidate(obj)
+
+def run_cbs_cached(
+    cbs: List[Callback],   # List of callbacks to run
+    obj: Any,              # Object to pass to the callbacks
+    cache: CheckpointCache # Checkpoint store
+    ):
+    "Run the callbacks, resuming from the longest cached prefix and checkpointing after each callback."
+    cbs = sorted(cbs, key=attrgetter('order'))
+    src = obj.df if obj.dfs is None else dict(obj.dfs)
+    keys = [fingerprint(src)]
+    # An observer leaves the data as is: it shares the checkpoint before it, which it is replayed on when skipped
+    for cb in cbs: keys.append(keys[-1] if cb.observer else cache.key(keys[-1], cb))
+    replayable = lambda i: all(keys[j] == keys[0] or cache.has(keys[j]) for j in range(i) if cbs[j].observer)
+    obj.n_cached = 0
+    for i in range(len(cbs), 0, -1):
+        if cbs[i - 1].observer or not replayable(i): continue
+        data = cache.load(keys[i])
+        if data is None: continue
+        obj.n_cached = i
+        break
+    for i, cb in enumerate(cbs):
+        log_cb(cb, obj)
+        if i < obj.n_cached:
+            if not cb.observer: continue
+            _set_data(obj, src if keys[i] == keys[0] else cache.load(keys[i]))
+        elif i == obj.n_cached > 0: _set_data(obj, data)
+        run_cb(cb, obj)
+        if i >= obj.n_cached and not cb.observer: cache.save(keys[i + 1], obj)
+    if len(cbs) == obj.n_cached > 0: _set_data(obj, data)
+
+# %% ../nbs/api/callbacks.ipynb #874ba14e
+def is_arrow(s: pd.Series) -> bool:
+    "Whether `s` is backed by a pyarrow array (`pd.ArrowDtype` or pyarrow-backed `StringDtype`)."
+    return isinstance(s.dtype, pd.ArrowDtype) or (isinstance(s.dtype, pd.StringDtype) and s.dtype.storage == 'pyarrow')
+
+def is_arrow_str(s: pd.Series) -> bool:
+    "Whether `s` holds strings in a pyarrow array."
+    if isinstance(s.dtype, pd.ArrowDtype): return pa.types.is_string(s.dtype.pyarrow_dtype) or pa.types.is_large_string(s.dtype.pyarrow_dtype)
+    return isinstance(s.dtype, pd.StringDtype) and s.dtype.storage == 'pyarrow'
+
+# %% ../nbs/api/callbacks.ipynb #5052904f
+def to_arrow(df: pd.DataFrame) -> pd.DataFrame:
+    "Convert the string columns of `df` to `string[pyarrow]`; numeric and mixed-type columns are left as is."
+    cols = [c for c in df.columns if (df[c].dtype == object or isinstance(df[c].dtype, pd.StringDtype))
+            and df[c].dtype != 'string[pyarrow]' and pd.api.types.infer_dtype(df[c], skipna=True) == 'string']
+    return df.astype({c: 'string[pyarrow]' for c in cols}) if cols else df
+
+# %% ../nbs/api/callbacks.ipynb #c8e84566
+def from_arrow(df: pd.DataFrame) -> pd.DataFrame:
+    "Convert the Arrow-backed columns of `df` to NumPy: strings to `object` with NaN for missing, others to their NumPy dtype."
+    conv = {}
+    for c in df.columns:
+        s = df[c]
+        # pandas >= 3 default `str` columns (NaN as missing value) already behave like NumPy object columns
+        if not is_arrow(s) or (isinstance(s.dtype, pd.StringDtype) and s.dtype.na_value is not pd.NA): continue
+        if is_arrow_str(s): conv[c] = s.astype(object).where(s.notna(), np.nan)
+        else: conv[c] = s.astype('float64' if s.dtype.kind in 'iub' and s.hasnans else s.dtype.numpy_dtype)
+    return df.assign(**conv) if conv else df
+
+# %% ../nbs/api/callbacks.ipynb #b7090cd0
+CAT_COLS = list(NC_DTYPES) + ['STATION'] # Columns held as Categoricals by `Transformer(categorical=True)`
+
+def is_categorical(s: pd.Series) -> bool:
+    "Whether `s` is a pandas Categorical."
+    return isinstance(s.dtype, pd.CategoricalDtype)
+
+def to_categorical(
+    df: pd.DataFrame,     # DataFrame to convert
+    cols: list=CAT_COLS,  # Columns to convert (those absent from `df` are skipped)
+    ) -> pd.DataFrame:
+    "Convert the columns `cols` of `df` to pandas Categoricals."
+    conv = [c for c in cols if c in df.columns and not is_categorical(df[c])]
+    return df.astype({c: 'category' for c in conv}) if conv else df
+
+def from_categorical(df: pd.DataFrame) -> pd.DataFrame:
+    "Convert the categorical columns of `df` back to the dtype of their categories (float for integers with missing values)."
+    conv = {}
+    for c in df.columns:
+        s = df[c]
+        if not is_categorical(s): continue
+        dtype = s.cat.categories.dtype
+        conv[c] = s.astype('float64' if dtype.kind in 'iub' and s.hasnans else dtype)
+    return df.assign(**conv) if conv else df
+
+def _recode_categorical(
+    codes: np.ndarray, # Category codes of each row (-1 for missing)
+    values: list,      # New value of each category, then of missing rows
+    ) -> pd.Categorical:
+    "Categorical holding `values[code]` for each row, merging the categories mapped to the same value."
+    new, cats = pd.factorize(pd.Series(values))
+    return pd.Categorical.from_codes(new[codes], categories=cats)
+
+def _categorize(obj, cols):
+    "Convert the columns `cols` of `obj`'s data to Categoricals in place."
+    for df in ([obj.df] if obj.dfs is None else obj.dfs.values()):
+        for c in cols:
+            if c in df.columns and not is_categorical(df[c]): df[c] = df[c].astype('category')
+
 # %% ../nbs/api/callbacks.ipynb #097d66b6
+def parse_coords(s: pd.Series) -> pd.Series:
+    "Parse `s` to floats in one vectorised pass, accepting `,` as decimal separator; unparsable values become NaN."
+    if pd.api.types.is_numeric_dtype(s): return s.astype(float)
+    txt = s if isinstance(s.dtype, pd.StringDtype) else s.astype(str).where(s.notna())
+    return pd.to_numeric(txt.str.replace(',', '.', regex=False), errors='coerce').astype(float)
+
 class SanitizeLonLatCB(PerGroupCB):
     "Drop rows with invalid longitude & latitude values. Convert `,` separator to `.` separator."
+    barrier,row_local = True,True
     def __init__(self, 
                  lon_col: str='LON', # Longitude column name
                  lat_col: str='LAT', # Latitude column name
-                 verbose: bool=False # Whether to print the number of invalid longitude & latitude values
+                 verbose: bool=False # Whether to print the number of unparsable or invalid longitude & latitude values
                  ):
         store_attr()
+        self.reads = self.writes = self.filters = [lon_col, lat_col]
 
     def each_grp(self, grp, df, tfm):
-        df[self.lon_col] = df[self.lon_col].apply(lambda x: float(str(x).replace(',', '.')))
-        df[self.lat_col] = df[self.lat_col].apply(lambda x: float(str(x).replace(',', '.')))
-        mask_zeroes = (df[self.lon_col] == 0) & (df[self.lat_col] == 0)
+        mask_bad = np.zeros(len(df), dtype=bool)
+        for col in (self.lon_col, self.lat_col):
+            parsed = parse_coords(df[col])
+            mask_bad |= (parsed.isna() & df[col].notna()).to_numpy()
+            df[col] = parsed
+        if mask_bad.sum() and self.verbose:
+            print(f'The "{grp}" group contains {mask_bad.sum()} unparsable {self.lon_col} or {self.lat_col} value(s).')
+        lon, lat = df[self.lon_col].to_numpy(), df[self.lat_col].to_numpy()
+        mask_zeroes = (lon == 0) & (lat == 0)
         if mask_zeroes.sum() and self.verbose:
             print(f'The "{grp}" group contains {mask_zeroes.sum()} data points whose ({self.lon_col}, {self.lat_col}) = (0, 0)')
-        mask_goob = (df[self.lon_col] < -180) | (df[self.lon_col] > 180) | (df[self.lat_col] < -90) | (df[self.lat_col] > 90)
+        mask_goob = (lon < -180) | (lon > 180) | (lat < -90) | (lat > 90)
         if mask_goob.sum() and self.verbose:
             print(f'The "{grp}" group contains {mask_goob.sum()} data points with unrealistic {self.lon_col} or {self.lat_col} values.')
-        tfm.dfs[grp] = df.loc[~(mask_zeroes | mask_goob)]
+        tfm.dfs[grp] = df.loc[~(mask_bad | mask_zeroes | mask_goob)]
+
+# %% ../nbs/api/callbacks.ipynb #879c5c66
+def map_unique(
+    s: pd.Series, # Column to transform
+    fn: Callable  # Pure function applied to each distinct value, missing values included
+    ) -> pd.Series: # Same as `s.map(fn)`, aligned with `s`
+    "Apply `fn` once per distinct value of `s` and gather the results back by code."
+    if not len(s): return s.map(fn) # Keeps the dtype `s.map` gives an empty column
+    codes, uniq = pd.factorize(s, use_na_sentinel=False)
+    if s.dtype == object and pd.api.types.infer_dtype(s, skipna=True).startswith('mixed'):
+        # `1`, `1.0` and `True` are one key to `factorize`: tell values of different types apart
+        tcodes = pd.factorize(s.map(type))[0]
+        codes = pd.factorize(codes * (tcodes.max() + 1) + tcodes)[0]
+        uniq = s.to_numpy(dtype=object)[np.unique(codes, return_index=True)[1]]
+    out = pd.Series([fn(v) for v in uniq]).take(codes)
+    out.index, out.name = s.index, s.name
+    return out
 
 # %% ../nbs/api/callbacks.ipynb #8c905654
 class RemapCB(PerGroupCB):
     "Remap source values to MARIS standard identifiers using a lookup table."
+    fusable = True
+    dense_max = 1 << 20 # Largest integer key remapped through a dense lookup array
     def __init__(self,
                  lut: dict|Callable,  # Lookup: dict, or callable(dfs)->dict
                  col_remap: str,            # Destination column to create
                  col_src: str,              # Source column with provider values
                  default_val: int=0,        # Value assigned to unmapped source values
                  grps: list[str]=None,      # Groups to process (None = all)
+                 verbose: bool=False,       # Print the number of unmapped values per group
                 ):
         store_attr()
+        self.reads,self.writes = [col_src],[col_remap]
+        self.n_unmapped = {}
         grp_str = ', '.join(str(g) for g in grps) if grps else 'all'
         self.__doc__ = f"Remap values from '{col_src}' to '{col_remap}' for groups: {grp_str}."
 
+    @property
+    def row_local(self): return not callable(self.lut) # A LUT built from the data needs all of it
+
     def _resolve_lut(self, tfm):
-        "Resolve the LUT: if a callable, call it with tfm's dfs to produce a dict."
+        "Resolve the LUT: if a callable, call it with tfm's dfs (and their `DistinctIndex`) to produce a dict."
         spec = self.lut
         if callable(spec):
             dfs = tfm.dfs if not tfm.is_single_df else {'_': tfm.df}
-            spec = spec(dfs)
+            spec = spec(GrpDfs(dfs, tfm.distinct))
         return spec
 
-    def __call__(self, tfm):
+    def _prepare(self, tfm):
+        "Resolve the LUT and, for small integer keys, build its dense lookup arrays; reset the counts, unless resuming a chunked run."
+        if not getattr(tfm, 'chunk', None): self.n_unmapped = {}
         self._resolved_lut = self._resolve_lut(tfm)
+        self._dense = self._dense_lut(self._resolved_lut)
+
+    def __call__(self, tfm):
+        self._prepare(tfm)
         super().__call__(tfm)
 
+    def _dense_lut(self, lut):
+        "Lookup arrays (values, found) indexed by key when all LUT keys are small non-negative integers, else None."
+        keys = list(lut)
+        if not keys or not all(isinstance(k, (int, np.integer)) and not isinstance(k, (bool, np.bool_)) for k in keys): return None
+        if min(keys) < 0 or max(keys) > self.dense_max: return None
+        vals = pd.Series([lut[k] for k in keys], dtype=object)
+        # One trailing slot holds the default, for ids outside the table
+        table, found = np.full(max(keys) + 2, self.default_val, dtype=int), np.zeros(max(keys) + 2, dtype=bool)
+        table[keys], found[keys] = vals.fillna(self.default_val).astype(int).values, vals.notna().values
+        return table, found
+
+    def strategy(self, s):
+        "Lookup strategy used for `s`: 'categorical', 'arrow', 'dense' or 'factorize'."
+        if is_categorical(s): return 'categorical'
+        if is_arrow_str(s): return 'arrow'
+        if isinstance(s.dtype, np.dtype) and s.dtype.kind in 'iu' and self._dense is not None: return 'dense'
+        return 'factorize'
+
+    def _remap_categorical(self, s):
+        "Remap a categorical column through its categories, returning a categorical."
+        cats = pd.Series(s.cat.categories)
+        vals, hit = getattr(self, f'_remap_{self.strategy(cats)}')(cats)
+        codes = s.cat.codes.to_numpy()
+        return _recode_categorical(codes, [*vals, self.default_val]), np.append(hit, False)[codes]
+
+    def _remap_arrow(self, s):
+        "Remap an Arrow-backed string column with `pyarrow.compute.index_in` instead of per-element dict lookups."
+        arr = pa.array(s.array)
+        keys = [k for k in self._resolved_lut if isinstance(k, str)]
+        vals = pd.Series([self._resolved_lut[k] for k in keys] + [None], dtype=object)
+        idx = pc.index_in(arr, value_set=pa.array(keys, type=arr.type)).fill_null(len(keys)).to_numpy()
+        return vals.fillna(self.default_val).astype(int).values[idx], vals.notna().values[idx]
+
+    def _remap_dense(self, s):
+        "Remap an integer column by indexing dense lookup arrays with its values."
+        table, found = self._dense
+        ids, n = s.to_numpy(), len(table) - 1
+        if len(ids) and (ids.min() < 0 or ids.max() >= n): ids = np.where((ids >= 0) & (ids < n), ids, n)
+        return table[ids], found[ids]
+
+    def _remap_factorize(self, s):
+        "Remap `s` by looking up its unique values only and broadcasting them back with the factorized codes."
+        codes, uniq = pd.factorize(s)
+        mapped = pd.Series(uniq).map(self._resolved_lut)
+        # Missing values get code -1, i.e. the trailing default
+        vals = np.append(mapped.fillna(self.default_val).astype(int).values, self.default_val)
+        return vals[codes], np.append(mapped.notna().values, False)[codes]
+
+    def _lookup(self, s):
+        "Remapped values of `s` and a mask of the values found in the LUT."
+        return getattr(self, f'_remap_{self.strategy(s)}')(s)
+
+    def _map(self, s):
+        "Remapped values of `s`."
+        return self._lookup(s)[0]
+
+    def _report(self, grp, n):
+        "Add `n` to the number of unmapped values recorded for `grp` (and optionally print it)."
+        self.n_unmapped[grp] = self.n_unmapped.get(grp, 0) + n
+        if self.verbose and n: print(f"Warning: {n} unmapped value(s) in '{self.col_src}' of {grp}")
+
+    def _merge_grp(self, cb, grp):
+        # The copy started from the counts of this callback
+        if grp in cb.n_unmapped: self.n_unmapped[grp] = cb.n_unmapped[grp]
+
     def each_grp(self, grp, df, tfm):
-        df[self.col_remap] = (df[self.col_src]
-            .map(self._resolved_lut).fillna(self.default_val).astype(int))
+        vals, hit = self._lookup(df[self.col_src])
+        df[self.col_remap] = vals
+        self._report(grp, int((~hit).sum()))
 
 # %% ../nbs/api/callbacks.ipynb #bd1917a0
+def lower_strip(x: str) -> str:
+    "Lowercase `x` and strip surrounding spaces."
+    return x.lower().strip()
+
+def _lower_strip_strs(s): return s.str.lower().str.strip()
+STR_KERNELS[lower_strip] = _lower_strip_strs
+
 class LowerStripNameCB(PerGroupCB):
     "Convert values to lowercase and strip any trailing spaces."
+    row_local,fusable = True,True
     def __init__(self, 
                  col_src: str, # Source column name e.g. 'Nuclide'
                  col_dst: str=None, # Destination column name
-                 fn_transform: Callable=lambda x: x.lower().strip() # Transformation function
+                 fn_transform: Callable=lower_strip # Transformation function
                  ):
         store_attr()
         self.__doc__ = f"Convert '{col_src}' column values to lowercase, strip spaces, and store in '{col_dst}' column."
         if not col_dst: self.col_dst = col_src
+        self.reads,self.writes = [col_src],[self.col_dst]
         
-    def _safe_transform(self, value):
-        "Ensure value is not NA and apply transformation function."
-        return value if pd.isna(value) else self.fn_transform(str(value))
+    def _map(self, s):
+        "Transformed values of `s`, computed once per distinct value (see `map_strs`); categorical columns stay categorical."
+        if is_categorical(s): 
+            return _recode_categorical(s.cat.codes.to_numpy(), [*self._map(pd.Series(s.cat.categories, dtype=object)), np.nan])
+        return map_strs(s, self.fn_transform, as_str=True)
 
-    def each_grp(self, grp, df, tfm): df[self.col_dst] = df[self.col_src].apply(self._safe_transform)
+    def each_grp(self, grp, df, tfm): df[self.col_dst] = self._map(df[self.col_src])
 
 # %% ../nbs/api/callbacks.ipynb #949d6471
 class AddSampleTypeIdColumnCB(PerGroupCB):
     "Add a column with the sample type as defined in the CDL."
+    row_local = True
     def __init__(self, 
                  lut: dict=SMP_TYPE_LUT, # Lookup table for sample type
                  col_name: str='SAMPLE_TYPE' # Column name to store the sample type id
                  ): 
         store_attr()
+        self.reads,self.writes = [],[col_name]
         
     def each_grp(self, grp, df, tfm): df[self.col_name] = self.lut[grp]
 
 # %% ../nbs/api/callbacks.ipynb #9da3e703
 class RenameColumnsCB(PerGroupCB):
     "Rename variables to MARIS standard names, keeping only renamed columns."
+    barrier,row_local = True,True
     def __init__(self,
                  renaming_rules: dict # Renaming rules {old_name: new_name}
                  ): 
         store_attr()
+        self.reads,self.writes = list(renaming_rules),list(renaming_rules.values())
         
     def each_grp(self, grp, df, tfm): tfm.dfs[grp] = df[self.renaming_rules.keys()].rename(columns=self.renaming_rules)
 
@@ -190,11 +1132,15 @@ class RenameColumnsCB(PerGroupCB):
 # %% ../nbs/api/callbacks.ipynb #1ea2cc64
 class RemoveAllNAValuesCB(Callback):
     "Remove rows with all NA values in specified columns."
+    barrier,row_local = True,True
     def __init__(self, 
                  cols_to_check: Union[Dict[str, list], list],  # Dict or list of columns to check
                  how: str='all'  # How to handle NA values 'all' or 'any'
                 ):
         store_attr()
+        cols = cols_to_check.values() if isinstance(cols_to_check, dict) else [cols_to_check]
+        self.reads,self.writes = list(dict.fromkeys(c for cs in cols for c in cs)),[]
+        self.filters = self.reads
 
     def __call__(self, tfm):
         # Convert list to dict if cols_to_check is a list
@@ -202,55 +1148,101 @@ class RemoveAllNAValuesCB(Callback):
                     else {k: self.cols_to_check for k in tfm.dfs.keys()})
         
         for sample_type, columns in cols_dict.items():
+            if sample_type not in tfm.dfs: continue
             tfm.dfs[sample_type].dropna(
                 subset=columns,
                 how=self.how,
                 inplace=True
             )
 
+# %% ../nbs/api/callbacks.ipynb #5b5f401b
+def _stack_take(
+    cols: list, # Series to gather from
+    idxs: list  # Row positions to take from each of them
+    ) -> np.ndarray|pd.api.extensions.ExtensionArray: # Gathered values, in order
+    "Concatenate `cols[i]` taken at `idxs[i]` into one pre-sized buffer."
+    if not all(isinstance(c.dtype, np.dtype) for c in cols): 
+        return pd.concat([c.take(i) for c, i in zip(cols, idxs)], ignore_index=True).array
+    out, pos = np.empty(sum(map(len, idxs)), dtype=np.result_type(*[c.dtype for c in cols])), 0
+    for c, i in zip(cols, idxs): 
+        out[pos:pos + len(i)] = np.take(c.to_numpy(), i)
+        pos += len(i)
+    return out
+
+# %% ../nbs/api/callbacks.ipynb #57374632
+class MeltPairsCB(PerGroupCB):
+    "Reshape value/uncertainty column pairs to long format by position: one row per measured value of each pair."
+    barrier = True
+    def __init__(self,
+                 pairs: list,           # Dicts with the `val`/`unc` columns of a pair and the constants to stamp, keyed by column
+                 grps: list=None,       # Groups to reshape; None = all
+                 keep: list=None,       # Columns carried over to the long rows; None = all
+                 val_name: str='VALUE', # Column of the values
+                 unc_name: str='UNC',   # Column of the uncertainties; NaN for pairs without `unc`
+                 ):
+        store_attr()
+        # Output columns in the order of the keys of the pairs
+        self._cols = {k: {'val': val_name, 'unc': unc_name}.get(k, k) for p in pairs for k in p}
+        self.reads = [p[k] for p in pairs for k in ('val', 'unc') if p.get(k)] + list(keep or [])
+        self.writes = list(self._cols.values())
+        self.src_pos = {} # Input position of each output row, per group, to follow source rows (see `run_cb`)
+
+    def __call__(self, tfm):
+        self.src_pos = {}
+        super().__call__(tfm)
+
+    def _merge_grp(self, cb, grp):
+        if grp in cb.src_pos: self.src_pos[grp] = cb.src_pos[grp]
+
+    def _stack(self, k, df, idxs, counts):
+        if k not in ('val', 'unc'): return pd.Series([p.get(k) for p in self.pairs]).repeat(counts).array
+        nan = pd.Series(np.nan, index=df.index)
+        return _stack_take([df[p[k]] if p.get(k) in df.columns else nan for p in self.pairs], idxs)
+
+    def each_grp(self, grp, df, tfm):
+        if not self.pairs: return
+        # Positions of the measured rows of each pair: the long frame is gathered from them in one go, with no join
+        idxs = [np.flatnonzero(df[p['val']].notna().to_numpy()) for p in self.pairs]
+        counts = [len(i) for i in idxs]
+        self.src_pos[grp] = pos = np.concatenate(idxs)
+        long = (df if self.keep is None else df[self.keep]).take(pos)
+        long.index = pd.RangeIndex(len(long))
+        tfm.dfs[grp] = long.assign(**{col: self._stack(k, df, idxs, counts) for k, col in self._cols.items()})
+
 # %% ../nbs/api/callbacks.ipynb #d7982397
-class MeltWideNuclidesCB(Callback):
+class MeltWideNuclidesCB(MeltPairsCB):
     "Reshape wide nuclide columns to long format using a named-dict spec."
     def __init__(self,
                  spec: list,           # List of dicts with keys: val, unc, nuclide, unit, lab
                  grp:  str='SEAWATER', # Group in tfm.dfs to reshape
                  ):
-        store_attr()
-
-    def __call__(self, tfm):
-        if self.grp not in tfm.dfs: return
-        df = tfm.dfs[self.grp]
-        frames = []
-        for s in self.spec:
-            sub = df.dropna(subset=[s['val']]).copy()
-            sub['NUCLIDE'] = s['nuclide']
-            sub['VALUE']   = sub[s['val']]
-            sub['UNC']     = sub[s['unc']]
-            sub['UNIT']    = s['unit']
-            sub['LAB']     = s['lab']
-            frames.append(sub)
-        if frames:
-            tfm.dfs[self.grp] = pd.concat(frames, ignore_index=True)
+        super().__init__([{'NUCLIDE': s['nuclide'], 'val': s['val'], 'unc': s['unc'], 'UNIT': s['unit'], 'LAB': s['lab']} 
+                          for s in spec], grps=[grp])
+        self.spec,self.grp = spec,grp
 
 # %% ../nbs/api/callbacks.ipynb #7bb09e18
 class AddSampleIDCB(PerGroupCB):
     "Assign 1-based sequential SMP_ID; optionally cast a provider ID column to str for NetCDF VLEN compatibility."
+    barrier = True
     def __init__(self,
                  col_provider: str=None,  # Provider ID column to cast to str; None = skip
                  ):
         store_attr()
+        # `col_provider` is optional in the data, hence written but not declared as read
+        self.reads,self.writes = [],['SMP_ID'] + ([col_provider] if col_provider else [])
 
     def each_grp(self, grp, df, tfm):
-        tfm.dfs[grp] = df.reset_index(drop=True)
-        tfm.dfs[grp]['SMP_ID'] = tfm.dfs[grp].index + 1
-        if self.col_provider and self.col_provider in tfm.dfs[grp].columns:
-            tfm.dfs[grp][self.col_provider] = tfm.dfs[grp][self.col_provider].astype(str).astype(object)
+        tfm.dfs[grp] = df = df.reset_index(drop=True)
+        df['SMP_ID'] = df.index + 1
+        if self.col_provider and self.col_provider in df.columns:
+            df[self.col_provider] = df[self.col_provider].astype(str).astype(object)
 
 # %% ../nbs/api/callbacks.ipynb #8cf07327
 class CompareDfsAndTfmCB(Callback):
     "Create a dataframe of removed data and track changes in row counts due to transformations."  # TODO: refactor - too long
+    observer = True
     def __init__(self, 
-                 dfs: Dict[str, pd.DataFrame]  # Original dataframes
+                 dfs: Dict[str, pd.DataFrame]=None  # Original dataframes, to report the removed rows themselves
                  ): 
         store_attr()
         
@@ -261,49 +1253,119 @@ class CompareDfsAndTfmCB(Callback):
 
     def _initialize_tfm_attributes(self, tfm: Transformer) -> None:
         tfm.dfs_removed = {}
+        tfm.rows_removed = {}
         tfm.compare_stats = {}
 
+    def _source_rows(self, grp, tfm):
+        "Bitmap of the original rows still present, and the source row of each transformed row (-1 = created)."
+        df, lineage = tfm.dfs[grp], getattr(tfm, 'lineage', None)
+        if lineage is not None and grp in lineage and grp in tfm.n_src:
+            src = lineage[grp]
+            n_src = tfm.n_src[grp]
+        else:
+            # Without lineage, fall back on matching index labels with the original dataframe
+            if self.dfs is None: raise ValueError("`CompareDfsAndTfmCB` needs `Transformer(track_rows=True)` or the original `dfs`")
+            src = self.dfs[grp].index.get_indexer(df.index)
+            n_src = len(self.dfs[grp])
+        kept = np.zeros(n_src, dtype=bool)
+        kept[src[src >= 0]] = True
+        return kept, src
+
     def _compute_changes(self, 
                          grp: str,  # The group key
                          tfm: Transformer  # The transformation object containing `dfs`
                         ) -> None:
         "Compute and store changes including data removed and created during transformation."
-        original_df = self.dfs[grp]
-        transformed_df = tfm.dfs[grp]
+        kept, src = self._source_rows(grp, tfm)
 
-        # Calculate differences
-        original_count = len(original_df.index)
-        transformed_count = len(transformed_df.index)
-        removed_count = len(original_df.index.difference(transformed_df.index))
-        created_count = len(transformed_df.index.difference(original_df.index))
+        # Rows created: rows without a source row, and further copies of one (e.g. melts)
+        removed = np.flatnonzero(~kept)
+        created_count = len(src) - int(kept.sum())
 
         # Store results
-        tfm.dfs_removed[grp] = original_df.loc[original_df.index.difference(transformed_df.index)]
+        tfm.rows_removed[grp] = removed
+        if self.dfs is not None: tfm.dfs_removed[grp] = self.dfs[grp].iloc[removed]
         tfm.compare_stats[grp] = {
-            'Original row count (dfs)': original_count,
-            'Transformed row count (tfm.dfs)': transformed_count,
-            'Rows removed from original (tfm.dfs_removed)': removed_count,
+            'Original row count (dfs)': len(kept),
+            'Transformed row count (tfm.dfs)': len(src),
+            'Rows removed from original (tfm.dfs_removed)': len(removed),
             'Rows created in transformed (tfm.dfs_created)': created_count
         }
 
 # %% ../nbs/api/callbacks.ipynb #3653a68d
 class UniqueIndexCB(PerGroupCB):
     "Set unique index for each group."
-    def __init__(self, index_name='ID'): store_attr()
+    barrier = True
+    def __init__(self, index_name='ID'): store_attr(); self.reads,self.writes = [],[index_name]
         
     def each_grp(self, grp, df, tfm):
         tfm.dfs[grp] = df.reset_index(drop=True).reset_index(names=[self.index_name])
 
+# %% ../nbs/api/callbacks.ipynb #0786948d
+def _downcast(s: pd.Series) -> pd.Series:
+    "`s` in the narrowest numeric dtype holding its values exactly (unchanged if there is none)."
+    if s.dtype.kind in 'iu':
+        # Not below 32 bits: narrower integers overflow silently in later arithmetic (e.g. summing counts)
+        if s.dtype.itemsize <= 4: return s
+        d = pd.to_numeric(s, downcast='integer' if s.dtype.kind == 'i' else 'unsigned')
+        return d if d.dtype.itemsize >= 4 else s.astype(f'{s.dtype.kind}4')
+    if s.dtype == np.float64:
+        f32 = s.astype(np.float32)
+        if np.array_equal(f32.to_numpy(dtype=np.float64), s.to_numpy(), equal_nan=True): return f32
+    return s
+
+class MemoryBudgetCB(Callback):
+    "Report memory usage per group, column and dtype; optionally downcast and categorize columns, and enforce a budget."
+    barrier = True # Sets `tfm.memory`, so it runs on the `Transformer` itself rather than a view under `dag`
+    def __init__(self,
+                 budget: int=None,       # Maximum total deep memory usage in bytes; None = report only
+                 downcast: bool=False,   # Downcast integer (to 32 bits at least) and float columns to the narrowest dtype holding their values exactly
+                 cat_ratio: float=None,  # Convert string columns with at most this ratio of distinct values to rows to Categoricals
+                 verbose: bool=False,    # Print the usage of each group
+                 ):
+        store_attr()
+        # Shrinking rewrites arbitrary columns
+        self.observer = not (downcast or cat_ratio)
+        self.reads,self.writes = ([], []) if self.observer else (None, None)
+
+    def _shrink(self, df):
+        conv = {}
+        for c in df.columns:
+            s = df[c]
+            if self.downcast and s.dtype.kind in 'iuf' and isinstance(s.dtype, np.dtype): conv[c] = _downcast(s)
+            elif (self.cat_ratio is not None and (s.dtype == object or isinstance(s.dtype, pd.StringDtype)) and len(s)
+                  and s.nunique() <= self.cat_ratio * len(s)): conv[c] = s.astype('category')
+        return df.assign(**{c: v for c, v in conv.items() if v.dtype != df[c].dtype})
+
+    def __call__(self, tfm):
+        dfs = {None: tfm.df} if tfm.dfs is None else tfm.dfs
+        if self.downcast or self.cat_ratio is not None:
+            dfs = {grp: self._shrink(df) for grp, df in dfs.items()}
+            if tfm.dfs is None: tfm.df = dfs[None]
+            else: tfm.dfs.update(dfs)
+        usage = pd.DataFrame([(grp, c, str(df[c].dtype), int(df[c].memory_usage(deep=True, index=False)))
+                              for grp, df in dfs.items() for c in df.columns], columns=['group', 'column', 'dtype', 'bytes'])
+        if getattr(tfm, 'memory', None) is None: tfm.memory = usage
+        else: tfm.memory = pd.concat([tfm.memory, usage], ignore_index=True)
+        total = int(usage.bytes.sum())
+        if self.verbose:
+            for grp, n in usage.groupby('group', sort=False, dropna=False).bytes.sum().items(): print(f"{grp}: {n/2**20:.1f} MiB")
+        if self.budget is not None and total > self.budget:
+            top = usage.nlargest(3, 'bytes').apply(lambda r: f"{r.group}.{r.column} ({r.dtype}, {r.bytes/2**20:.1f} MiB)", axis=1)
+            raise MemoryError(f"{total/2**20:.1f} MiB used, budget is {self.budget/2**20:.1f} MiB; largest: {', '.join(top)}")
+
 # %% ../nbs/api/callbacks.ipynb #c787de45
 class ParseTimeCB(PerGroupCB):
     "Parse time column from ISO8601 string to datetime."
-    def __init__(self, time_col_name: str='TIME'): store_attr()
+    row_local = True
+    def __init__(self, time_col_name: str='TIME'): store_attr(); self.reads = self.writes = [time_col_name]
     def each_grp(self, grp, df, tfm):
         df[self.time_col_name] = pd.to_datetime(df[self.time_col_name], format='ISO8601')
 
 # %% ../nbs/api/callbacks.ipynb #7f03e81c
 class EncodeTimeCB(PerGroupCB):
     "Encode time as seconds since epoch."    
+    barrier,row_local = True,True
     def __init__(self, 
                    col_time: str='TIME',  # Time column name
                    verbose: bool=False,  # Print warning about missing time values
@@ -311,27 +1373,79 @@ class EncodeTimeCB(PerGroupCB):
                  ): 
         store_attr()
         self.units = fn_units()
+        self.reads = self.writes = self.filters = [col_time]
 
     def each_grp(self, grp: str, df: pd.DataFrame, tfm):
         n_missing = df[self.col_time].isna().sum()
         if self.verbose and n_missing: print(f"Warning: {n_missing} missing time value(s) in {grp}")
-        tfm.dfs[grp] = df[df[self.col_time].notna()]
-        tfm.dfs[grp][self.col_time] = tfm.dfs[grp][self.col_time].apply(lambda x: date2num(x, units=self.units))
+        if n_missing: df = df[df[self.col_time].notna()]
+        tfm.dfs[grp] = df.assign(**{self.col_time: encode_times(df[self.col_time], self.units)})
 
 # %% ../nbs/api/callbacks.ipynb #41dcef31
 class DecodeTimeCB(PerGroupCB):
     "Decode time from seconds since epoch to datetime format."    
+    barrier,row_local = True,True
     def __init__(self, 
                  col_time: str='TIME',
                  fn_units: Callable=get_time_units # Function returning the time units
                  ): 
         store_attr()
         self.units = fn_units()
+        self.reads = self.writes = self.filters = [col_time]
 
     def each_grp(self, grp, df, tfm):
         n_missing = df[self.col_time].isna().sum()
         if n_missing: print(f"Warning: {n_missing} missing time value(s) in {grp}.")
-        tfm.dfs[grp] = df[df[self.col_time].notna()]
-        tfm.dfs[grp][self.col_time] = tfm.dfs[grp][self.col_time].apply(
-            lambda x: num2date(x, units=self.units, only_use_cftime_datetimes=False)
-        )
+        if n_missing: df = df[df[self.col_time].notna()]
+        tfm.dfs[grp] = df.assign(**{self.col_time: decode_times(df[self.col_time], self.units)})
+
+# %% ../nbs/api/callbacks.ipynb #a34d5a6b
+def iter_chunks(
+    obj: Any,           # `Transformer` (or view) holding `df` or `dfs`
+    chunksize: int=None # Rows per chunk; None = whole groups
+    ):
+    "Yield row chunks of `obj.df`, or single-group `{grp: chunk}` dicts of `obj.dfs`."
+    dfs = {None: obj.df} if obj.dfs is None else obj.dfs
+    for grp, df in list(dfs.items()):
+        # Empty groups still yield one (empty) chunk so that their columns get transformed
+        for start in range(0, max(len(df), 1), chunksize or max(len(df), 1)):
+            chunk = df.iloc[start:start + (chunksize or len(df))]
+            yield chunk if grp is None else {grp: chunk}
+
+# %% ../nbs/api/callbacks.ipynb #8550795b
+def _run_chunked(cbs, obj, chunks):
+    parts, lineage = defaultdict(list), _lineage(obj)
+    for i, chunk in enumerate(chunks):
+        view = GrpView(parent=obj, df=chunk) if isinstance(chunk, pd.DataFrame) else GrpView(dict(chunk), parent=obj)
+        view.chunk = i
+        for cb in cbs: run_cb(cb, view)
+        for grp, df in ({None: view.df} if view.dfs is None else view.dfs).items(): parts[grp].append(df)
+    if obj.dfs is None: 
+        if parts[None]: obj.df = pd.concat(parts[None])
+    else:
+        obj.dfs.clear()
+        obj.dfs.update({grp: pd.concat(dfs) for grp, dfs in parts.items()})
+    # Chunks keep their index labels: source rows are followed over the whole run of chunked callbacks
+    if lineage is not None: _sync_lineage(obj, lineage)
+    _invalidate(obj)
+
+# %% ../nbs/api/callbacks.ipynb #da596458
+def run_cbs_chunked(
+    cbs: List[Callback],  # List of callbacks to run
+    obj: Any,             # Object to pass to the callbacks
+    chunksize: int=None,  # Rows per chunk when splitting the data held by `obj`
+    chunks: Iterable=None # Chunks (DataFrames or `{grp: DataFrame}` dicts) to read instead of `obj`'s data
+    ):
+    "Run consecutive row-local callbacks chunk by chunk, materialising the data before each callback that needs all rows."
+    cbs, i = sorted(cbs, key=attrgetter('order')), 0
+    while True:
+        j = i
+        while j < len(cbs) and cbs[j].row_local: j += 1
+        for cb in cbs[i:j]:
+            log_cb(cb, obj)
+        if i < j or chunks is not None: _run_chunked(cbs[i:j], obj, chunks if chunks is not None else iter_chunks(obj, chunksize))
+        chunks = None
+        if j == len(cbs): break
+        log_cb(cbs[j], obj)
+        run_cb(cbs[j], obj)
+        i = j + 1
@@ -6,17 +6,20 @@ Docs: https://franckalbinet.github.io/mariscoapi/configs.html.md"""
 
 # %% auto #0
 __all__ = ['AVOGADRO', 'NA', 'NC_DIM', 'NC_CSV', 'NC_VARS', 'CSV_VARS', 'NC_GROUPS', 'SMP_TYPE_LUT', 'NC_DTYPES', 'CSV_DTYPES',
-           'ZOTERO_LIB_ID', 'NC_GLOBAL_ATTRS', 'NETCDF_TO_PYTHON_TYPE', 'lut_path', 'lut_fname', 'nc_tpl_path',
-           'cache_path', 'get_time_units', 'sanitize', 'try_int', 'get_lut', 'Enums']
+           'ZOTERO_LIB_ID', 'NC_GLOBAL_ATTRS', 'NETCDF_TO_PYTHON_TYPE', 'STR_KERNELS', 'lut_path', 'lut_fname',
+           'nc_tpl_path', 'cache_path', 'TemplateSchema', 'template_schema', 'get_time_units', 'sanitize', 'map_strs',
+           'try_int', 'get_lut', 'Enums']
 
 # %% ../nbs/api/configs.ipynb #3f92bc7b
 from pathlib import Path
+import json
 import os
 import re
-from typing import Any, Dict, Union
+from typing import Any, Callable, Dict, Union
+import numpy as np
 import pandas as pd
 from fastcore.all import *
-from netCDF4 import Dataset
+from netCDF4 import Dataset, EnumType
 from importlib.resources import files as _pkg_files
 
 # %% ../nbs/api/configs.ipynb #b0bee1e5
@@ -231,6 +234,62 @@ def cache_path() -> Path: # Path to cache directory
     p.mkdir(parents=True, exist_ok=True)
     return p
 
+# %% ../nbs/api/configs.ipynb #d77c729d
+class TemplateSchema:
+    "In-memory description of a MARIS NetCDF template: global attributes and, per group, dimensions and variables."
+    def __init__(self, 
+                 attrs: dict,  # Global attributes
+                 groups: dict, # {group: {'dims': {name: size or None if unlimited}, 'vars': {name: {'dims', 'dtype', 'enum', 'attrs'}}}}
+                 ): 
+        store_attr()
+
+    @classmethod
+    def from_nc(cls, 
+                fname: str|Path # Path to the NetCDF template
+               ):
+        "Read the schema of NetCDF template `fname`."
+        def _var(v): return {'dims': list(v.dimensions), 'dtype': 'str' if v.dtype == str else np.dtype(v.dtype).name,
+                             'enum': v.datatype.name if isinstance(v.datatype, EnumType) else None, 'attrs': v.__dict__}
+        with Dataset(fname, 'r') as nc:
+            return cls(nc.__dict__, {name: {'dims': {d: None if dim.isunlimited() else len(dim) for d, dim in grp.dimensions.items()},
+                                            'vars': {n: _var(v) for n, v in grp.variables.items()}} 
+                                     for name, grp in nc.groups.items()})
+
+    @classmethod
+    def from_json(cls, 
+                  fname: str|Path # Path to a snapshot written by `to_json`
+                 ):
+        "Load a schema snapshot."
+        return cls(**json.loads(Path(fname).read_text()))
+
+    def to_json(self, 
+                fname: str|Path # Path of the snapshot to write
+               ):
+        "Save the schema as a JSON snapshot."
+        Path(fname).write_text(json.dumps({'attrs': self.attrs, 'groups': self.groups}, indent=1, default=lambda o: o.tolist()))
+
+    def dims(self, grp: str) -> dict: return self.groups[grp]['dims'] # Dimensions of NetCDF group `grp`
+    def vars(self, grp: str) -> dict: return self.groups[grp]['vars'] # Variables of NetCDF group `grp`
+
+    @property
+    def time_units(self) -> str:
+        "Units attribute of the time variable."
+        for grp in self.groups.values():
+            if 'time' in grp['vars']: return grp['vars']['time']['attrs']['units']
+        raise ValueError("Time variable not found in NetCDF file")
+
+# %% ../nbs/api/configs.ipynb #957a0a7c
+_SCHEMAS = {}
+
+def template_schema(
+    fname: str|Path=None # NetCDF template or JSON snapshot; None = `nc_tpl_path()`
+    ) -> TemplateSchema:
+    "Schema of template `fname`, read once per process and shared by all callers."
+    key = str(fname or nc_tpl_path())
+    if key not in _SCHEMAS: 
+        _SCHEMAS[key] = (TemplateSchema.from_json if key.endswith('.json') else TemplateSchema.from_nc)(key)
+    return _SCHEMAS[key]
+
 # %% ../nbs/api/configs.ipynb #f63b3971
 NETCDF_TO_PYTHON_TYPE = {
     'u8': int,
@@ -239,14 +298,12 @@ NETCDF_TO_PYTHON_TYPE = {
 
 # %% ../nbs/api/configs.ipynb #97b6b0ec
 def get_time_units() -> str:
-    "Get the units attribute of the time variable from a NetCDF file."
-    with Dataset(nc_tpl_path(), 'r') as nc:
-        for group in nc.groups.values():
-            if 'time' in group.variables:
-                return group.variables['time'].units
-    raise ValueError("Time variable not found in NetCDF file")
+    "Get the units attribute of the time variable from the (cached) MARIS NetCDF template schema."
+    return template_schema().time_units
 
 # %% ../nbs/api/configs.ipynb #7e994e93
+_RE_DROP, _RE_SPACE = re.compile(r'[().]'), re.compile(r'[/-]')
+
 def sanitize(
     s: str|float # String or float to sanitize
     ) -> str|float:  # Sanitized string or original float
@@ -258,13 +315,40 @@ def sanitize(
     - Return original value if it's not a string (e.g., NaN)
     """
     if isinstance(s, str):
-        s = re.sub(r'[().]', '', s)
-        return re.sub(r'[/-]', ' ', s).strip()
+        return _RE_SPACE.sub(' ', _RE_DROP.sub('', s)).strip()
     elif pd.isna(s):  # This covers np.nan, None, and pandas NaT
         return s
     else:
         return str(s).strip()
 
+# %% ../nbs/api/configs.ipynb #5e5ab4cd
+def _sanitize_strs(s: pd.Series) -> pd.Series:
+    return s.str.replace(_RE_DROP, '', regex=True).str.replace(_RE_SPACE, ' ', regex=True).str.strip()
+
+STR_KERNELS = {sanitize: _sanitize_strs} # String function -> equivalent on a Series of strings
+
+def map_strs(
+    values,              # Values to transform: Series, Index or list-like
+    fn: Callable=sanitize, # Function applied to each distinct non-missing value
+    as_str: bool=False   # Convert non-string values with `str` before applying `fn`
+    ) -> pd.Series:      # Transformed values, aligned with `values`
+    "Apply `fn` once per distinct value of `values`, on all distinct strings at once if `fn` has a kernel in `STR_KERNELS`."
+    s = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    # `1`, `1.0` and `True` are one key to `factorize` but three strings
+    codes, uniq = pd.factorize(s.astype(str).where(s.notna(), s) if as_str and s.dtype == object else s)
+    uniq = pd.Series(np.asarray(uniq, dtype=object))
+    if as_str: uniq = uniq.map(str)
+    is_str, kernel, res = uniq.map(type).eq(str).to_numpy(), STR_KERNELS.get(fn), uniq.copy()
+    if kernel is not None and is_str.any(): res[is_str] = kernel(uniq[is_str].astype(object)).to_numpy(dtype=object)
+    rest = ~is_str if kernel is not None else np.ones(len(uniq), dtype=bool)
+    if rest.any(): res[rest] = uniq[rest].map(fn)
+    out = res.to_numpy(dtype=object)[codes]
+    out[codes < 0] = s.to_numpy(dtype=object)[codes < 0]
+    out = pd.Series(out, index=s.index, name=s.name)
+    # Keep Arrow-backed strings in Arrow
+    if isinstance(s.dtype, pd.StringDtype) and res.map(type).eq(str).all(): out = out.astype(s.dtype)
+    return out
+
 # %% ../nbs/api/configs.ipynb #57772123
 def try_int(x:Any         # Value to attempt integer conversion on
             )->int|Any:   # Integer if successful, or the original value
@@ -310,7 +394,7 @@ def get_lut(
     
     df = df.set_index(key)
     lut = df[value].to_dict()
-    if do_sanitize: lut = {sanitize(k): v for k, v in lut.items()}
+    if do_sanitize: lut = dict(zip(map_strs(list(lut)), lut.values()))
     lut = {try_int(k): try_int(v) for k, v in lut.items()}    
     return {v: k for k, v in lut.items()} if reverse else lut
 
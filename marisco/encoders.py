@@ -14,20 +14,23 @@ import pandas as pd
 from typing import Dict, Callable
 import numpy as np
 from fastcore.all import *
-from .configs import NC_DTYPES, NC_VARS, NC_DIM, NC_GROUPS, lut_path, Enums, nc_tpl_path
+from .configs import NC_DTYPES, NC_VARS, NC_DIM, NC_GROUPS, lut_path, Enums, nc_tpl_path, template_schema
+from .callbacks import from_arrow
 
 # %% ../nbs/api/encoders.ipynb #2e31b9dd
 class NetCDFEncoder:
     "MARIS NetCDF encoder: transforms handler-curated DataFrames into a self-contained NetCDF4 file."
     def __init__(self, 
-                 dfs: Dict[str, pd.DataFrame], # {NC_GROUPS key → DataFrame}, e.g. {'SEAWATER': df_sw, 'BIOTA': df_bio}
+                 dfs: Dict[str, pd.DataFrame], # {NC_GROUPS key → DataFrame}, e.g. {'SEAWATER': df_sw, 'BIOTA': df_bio}; Arrow-backed columns are converted to NumPy
                  dest_fname: str, # Name of output file to produce
                  global_attrs: Dict[str, str], # NetCDF global attributes (id, title, summary, keywords, ...)
-                 fn_src_fname: Callable=nc_tpl_path, # Callable returning path to the MARIS NetCDF template
+                 fn_src_fname: Callable=nc_tpl_path, # Callable returning path to the MARIS NetCDF template (or a JSON snapshot of its schema)
                  verbose: bool=False, # Print currently written NetCDF group and variable names
                  ):
         store_attr()
+        self.dfs = {k: from_arrow(v) for k, v in dfs.items()}
         self.src_fname = fn_src_fname()
+        self.schema = template_schema(self.src_fname)
         self.enum_dtypes = {}
         self.nc_to_cols = {v:k for k,v in NC_VARS.items()}
 
@@ -35,7 +38,7 @@ class NetCDFEncoder:
 @patch 
 def copy_global_attrs(self:NetCDFEncoder):
     "Update NetCDF template global attributes as specified by `global_attrs` argument."
-    self.dest.setncatts(self.src.__dict__)
+    self.dest.setncatts(self.schema.attrs)
     for k, v in self.global_attrs.items(): self.dest.setncattr(k, v)
 
 # %% ../nbs/api/encoders.ipynb #a6909975
@@ -45,9 +48,7 @@ def copy_dims(
     grp_dest,  # Destination NetCDF group
     ):
     "Copy dimensions from template into a group."
-    src_dim = self.src.groups[grp_dest.name].dimensions
-    for name, dim in src_dim.items():
-        grp_dest.createDimension(name, (len(dim) if not dim.isunlimited() else None))
+    for name, size in self.schema.dims(grp_dest.name).items(): grp_dest.createDimension(name, size)
 
 # %% ../nbs/api/encoders.ipynb #6e24da73
 @patch
@@ -78,7 +79,7 @@ def copy_vars(
     ):
     "Copy variables from template into group, filling from df."
     cols = [NC_VARS[col] for col in df.columns if col in NC_VARS]
-    for var_name, var_src in self.src.groups[grp_name].variables.items():
+    for var_name, var_src in self.schema.vars(grp_name).items():
         if var_name in cols: self.copy_var(var_name, var_src, df, grp_dest)
 
 # %% ../nbs/api/encoders.ipynb #40561907
@@ -86,12 +87,12 @@ def copy_vars(
 def copy_var(
     self:NetCDFEncoder,
     var_name:str,  # NetCDF variable name
-    var_src,  # Source template variable
+    var_src:dict,  # Template variable from `TemplateSchema` (dims, dtype, enum, attrs)
     df:pd.DataFrame,  # DataFrame with the data
     grp_dest,  # Destination NetCDF group
     ):
     "Copy a single variable: create, populate, copy attrs."
-    dtype_name = var_src.datatype.name
+    dtype_name = var_src['enum'] or var_src['dtype']
     if self.verbose:
         print(80*'-')
         print(f'Group: {grp_dest.name}, Variable: {var_name}')
@@ -104,12 +105,12 @@ def copy_var(
 @patch
 def var_type(
     self:NetCDFEncoder,
-    dtype_name:str,  # Datatype name from template
-    var_src,  # Source template variable
+    dtype_name:str,  # Datatype name from template (enum type name for enum variables)
+    var_src:dict,  # Template variable from `TemplateSchema` (dims, dtype, enum, attrs)
     ):
     "Pick enum type if available, else template datatype."
-    if var_src.dtype == str: return str
-    return self.enum_dtypes.get(dtype_name, var_src.datatype)
+    if var_src['dtype'] == 'str': return str
+    return self.enum_dtypes.get(dtype_name, np.dtype(var_src['dtype']))
 
 # %% ../nbs/api/encoders.ipynb #1f638ff9
 @patch
@@ -134,9 +135,11 @@ def fill_var(
     df:pd.DataFrame,  # DataFrame with the data
     ):
     "Populate a NetCDF variable from a DataFrame column."
-    values = df[self.nc_to_cols[var_name]].values
+    col = df[self.nc_to_cols[var_name]]
+    values = col.values
     is_enum = hasattr(variable_type, '__class__') and 'EnumType' in str(type(variable_type))
-    if is_enum: values = self.fillna_enum(values)
+    if is_enum: values = self.cat_enum_values(col) if isinstance(col.dtype, pd.CategoricalDtype) else self.fillna_enum(values)
+    elif isinstance(col.dtype, pd.CategoricalDtype): values = np.asarray(values)
     if variable_type == str:
         for i,v in enumerate(values): grp_dest[var_name][i] = v
     else:
@@ -156,16 +159,28 @@ def fillna_enum(
     return values.astype(np.int64)
 
 
+# %% ../nbs/api/encoders.ipynb #158fd7d2
+@patch
+def cat_enum_values(
+    self:NetCDFEncoder,
+    s:pd.Series,  # Categorical column of enum values
+    fill_value:int=-1,  # Sentinel for missing enum values
+    ):
+    "Enum values of a categorical column, gathered from its categories with its integer codes."
+    cats = np.append(s.cat.categories.to_numpy(dtype=float), fill_value)
+    cats[np.isnan(cats)] = fill_value
+    return cats.astype(np.int64)[s.cat.codes.to_numpy()]
+
 # %% ../nbs/api/encoders.ipynb #6068704d
 @patch
 def copy_var_attrs(
     self:NetCDFEncoder,
     var_name:str,  # NetCDF variable name
-    var_src,  # Source template variable
+    var_src:dict,  # Template variable from `TemplateSchema` (dims, dtype, enum, attrs)
     grp_dest,  # Destination NetCDF group
     ):
     "Copy attributes from template variable to destination."
-    grp_dest[var_name].setncatts(var_src.__dict__)
+    grp_dest[var_name].setncatts(var_src['attrs'])
 
 # %% ../nbs/api/encoders.ipynb #6b7c5992
 @patch(as_prop=True)
@@ -189,8 +204,8 @@ def create_enums(self:NetCDFEncoder):
 # %% ../nbs/api/encoders.ipynb #20edc912
 @patch
 def encode(self:NetCDFEncoder):
-    "Encode MARIS NetCDF based on template and dataframes."
-    with Dataset(self.src_fname, format='NETCDF4') as self.src, Dataset(self.dest_fname, 'w', format='NETCDF4') as self.dest:
+    "Encode MARIS NetCDF based on template schema and dataframes."
+    with Dataset(self.dest_fname, 'w', format='NETCDF4') as self.dest:
         self.copy_global_attrs()
         self.create_enums()
         self.process_grps()
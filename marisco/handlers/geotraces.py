@@ -3,11 +3,11 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/handlers/geotraces.ipynb.
 
 # %% auto #0
-__all__ = ['fname_in', 'fname_out', 'zotero_key', 'load_data', 'common_coi', 'nuclides_pattern', 'phase', 'smp_method',
-           'nuclides_name', 'units_lut', 'renaming_rules', 'lut_nuclides', 'kw', 'SelectColsOfInterestCB',
-           'WideToLongCB', 'ExtractUnitCB', 'ExtractFilteringStatusCB', 'ExtractSamplingMethodCB', 'RenameNuclideCB',
+__all__ = ['fname_in', 'fname_out', 'zotero_key', 'common_coi', 'nuclides_pattern', 'phase', 'smp_method', 'nuclides_name',
+           'units_lut', 'renaming_rules', 'kw', 'sample_keys', 'load_data', 'SelectColsOfInterestCB', 'WideToLongCB',
+           'ExtractUnitCB', 'ExtractFilteringStatusCB', 'ExtractSamplingMethodCB', 'RenameNuclideCB',
            'StandardizeUnitCB', 'RenameColumnCB', 'UnshiftLongitudeCB', 'DispatchToGroupCB', 'AddSampleIDCB',
-           'get_attrs', 'encode']
+           'lut_nuclides', 'get_attrs', 'pipeline', 'encode']
 
 # %% ../../nbs/handlers/geotraces.ipynb #3a8d979f
 from fastcore.all import *
@@ -22,7 +22,8 @@ from marisco.callbacks import (
     ParseTimeCB,
     SanitizeLonLatCB, 
     EncodeTimeCB,
-    RemapCB
+    RemapCB,
+    map_unique
 )
 
 from marisco.metadata import (
@@ -44,7 +45,9 @@ fname_out = '../../_data/output/190-geotraces-2021.nc'
 zotero_key = '97UIMEXN'
 
 # %% ../../nbs/handlers/geotraces.ipynb #70d6efc1
-load_data = lambda fname: pd.read_csv(fname_in)
+def load_data(fname): 
+    "Read the raw GEOTRACES discrete sample CSV."
+    return pd.read_csv(fname)
 
 # %% ../../nbs/handlers/geotraces.ipynb #8d3a7bba-39d7-4fc3-8f0e-fb83ff52dcc2
 # Metadata columns always kept as identifiers when reshaping wide → long
@@ -101,7 +104,7 @@ class ExtractUnitCB(Callback):
         return match.group(1) if match else None
         
     def __call__(self, tfm):
-        tfm.df[self.unit_col_name] = tfm.df[self.var_name].apply(self.extract_unit)
+        tfm.df[self.unit_col_name] = map_unique(tfm.df[self.var_name], self.extract_unit)
 
 # %% ../../nbs/handlers/geotraces.ipynb #efb9477e-f593-4d15-b8b8-c073bd6bb590
 # Phase code embedded in column names → FILT status and sample type group
@@ -134,8 +137,8 @@ class ExtractFilteringStatusCB(Callback):
         return self.phase[matched_string.group(1)]['group'] if matched_string else None
         
     def __call__(self, tfm):
-        tfm.df[self.filt_col_name] = tfm.df[self.var_name].apply(self.extract_filt_status)
-        tfm.df['GROUP'] = tfm.df[self.var_name].apply(self.extract_group)
+        tfm.df[self.filt_col_name] = map_unique(tfm.df[self.var_name], self.extract_filt_status)
+        tfm.df['GROUP'] = map_unique(tfm.df[self.var_name], self.extract_group)
 
 # %% ../../nbs/handlers/geotraces.ipynb #e7c79502-f09e-49c0-851b-cdb2eca82eac
 # Sampling method code → MARIS method ID mapping (to be validated)
@@ -160,7 +163,7 @@ class ExtractSamplingMethodCB(Callback):
         return self.smp_method[match.group(1)] if match else None
         
     def __call__(self, tfm):
-        tfm.df[self.smp_method_col_name] = tfm.df[self.var_name].apply(self.extract_smp_method)
+        tfm.df[self.smp_method_col_name] = map_unique(tfm.df[self.var_name], self.extract_smp_method)
 
 # %% ../../nbs/handlers/geotraces.ipynb #8eb5c23c-8930-4100-b9bc-d536d2b8d3b6
 # Provider-specific nuclide name overrides for MARIS standardisation
@@ -185,7 +188,7 @@ class RenameNuclideCB(Callback):
         return self.nuclides_name[s] if s in self.nuclides_name else s.lower().replace('_', '')
         
     def __call__(self, tfm):
-        tfm.df[self.var_name] = tfm.df[self.var_name].apply(self.standardize_name)
+        tfm.df[self.var_name] = map_unique(tfm.df[self.var_name], self.standardize_name)
 
 # %% ../../nbs/handlers/geotraces.ipynb #80145187-bb90-4428-9d31-77a82ec916b4
 # Geotraces unit → MARIS unit ID and conversion factor mapping
@@ -272,8 +275,9 @@ class AddSampleIDCB(PerGroupCB):
         df['SMP_ID_PROVIDER'] = df['SMP_ID_PROVIDER'].astype(str)
 
 # %% ../../nbs/handlers/geotraces.ipynb #57f34e80
-# Lookup table: MARIS nc_name → nuclide_id
-lut_nuclides = lambda: get_lut('NUCLIDE', reverse=False)
+def lut_nuclides(dfs=None): 
+    "Lookup table: MARIS nc_name → nuclide_id."
+    return get_lut('NUCLIDE', reverse=False)
 
 # %% ../../nbs/handlers/geotraces.ipynb #f98fd736
 kw = ['oceanography', 'Earth Science > Oceans > Ocean Chemistry> Radionuclides',
@@ -303,15 +307,13 @@ def get_attrs(
         KeyValuePairCB('publisher_postprocess_logs', ', '.join(tfm.logs))
         ])()
 
-# %% ../../nbs/handlers/geotraces.ipynb #d591d3f2-8843-4dad-9514-d7e2d77af592
-def encode(
-        fname_in:str,    # Path to the raw Geotraces input CSV (the IDP2021 discrete sample data)
-        fname_out:str,   # Destination path for the NetCDF4 output file
-        **kwargs         # Pass verbose=True for detailed NetCDFEncoder output
-        ):
-    "Orchestrate the full Geotraces curation pipeline: load, transform, and encode to MARIS NetCDF4 format."
-    df = pd.read_csv(fname_in)
-    tfm = Transformer(df, cbs=[
+# %% ../../nbs/handlers/geotraces.ipynb #bde13539
+# Nuclides are columns of the raw CSV, so a smoke run (`encode(sample=True)`) keeps a few rows of each cruise
+sample_keys = ['Cruise']
+
+def pipeline() -> list:
+    "Callbacks of the GEOTRACES encoding pipeline, in run order."
+    return [
         SelectColsOfInterestCB(common_coi, nuclides_pattern),
         WideToLongCB(common_coi, nuclides_pattern),
         ExtractUnitCB(),
@@ -326,8 +328,19 @@ def encode(
         ParseTimeCB(),
         EncodeTimeCB(),
         SanitizeLonLatCB(),
-        RemapCB(fn_lut=lut_nuclides, col_remap='NUCLIDE', col_src='NUCLIDE')
-        ])
+        RemapCB(lut=lut_nuclides, col_remap='NUCLIDE', col_src='NUCLIDE')
+    ]
+
+# %% ../../nbs/handlers/geotraces.ipynb #d591d3f2-8843-4dad-9514-d7e2d77af592
+def encode(
+        fname_in:str,    # Path to the raw Geotraces input CSV (the IDP2021 discrete sample data)
+        fname_out:str,   # Destination path for the NetCDF4 output file
+        **kwargs         # Pass verbose=True for detailed NetCDFEncoder output, sample=True for a smoke run
+        ):
+    "Orchestrate the full Geotraces curation pipeline: load, transform, and encode to MARIS NetCDF4 format."
+    df = pd.read_csv(fname_in)
+    sample = kwargs.get('sample', False)
+    tfm = Transformer(df, cbs=pipeline(), sample=sample_keys if sample is True else sample, sample_min=kwargs.get('sample_min', 1))
     
     tfm()
     encoder = NetCDFEncoder(tfm.dfs, 
@@ -4,13 +4,13 @@
 
 # %% auto #0
 __all__ = ['src_dir', 'fname_out', 'zotero_key', 'default_smp_types', 'fixes_nuclide_names', 'nuclide_lut', 'coi_sediment',
-           'coi_val', 'coi_units_unc', 'lut_units', 'coi_dl', 'provider_lut_species', 'fixes_species', 'species_lut',
-           'provider_lut_tissues', 'fixes_biota_tissues', 'lut_tissues', 'lut_biogroup', 'provider_lut_sed',
-           'fixes_sediments', 'sed_replace_lut', 'sediment_lut', 'lut_filtered', 'basis_fix', 'kw', 'load_data',
-           'ParseTimeCB', 'MeltSedimentValuesCB', 'SanitizeValueCB', 'NormalizeUncCB', 'RemapUnitCB',
-           'RemapDetectionLimitCB', 'CleanSedimentCodesCB', 'AddSampleIDCB', 'AddDepthCB', 'AddSalinityCB',
-           'AddStationCB', 'AddTemperatureCB', 'RemapSedSliceTopBottomCB', 'CleanBasisCB', 'PercentWeightCB',
-           'WeightCB', 'ParseCoordinatesCB', 'get_attrs', 'encode']
+           'coi_val', 'coi_units_unc', 'lut_units', 'coi_dl', 'fixes_species', 'species_lut', 'fixes_biota_tissues',
+           'lut_tissues', 'lut_biogroup', 'fixes_sediments', 'sed_replace_lut', 'sediment_lut', 'lut_filtered',
+           'basis_fix', 'kw', 'sample_keys', 'load_data', 'ParseTimeCB', 'MeltSedimentValuesCB', 'SanitizeValueCB',
+           'NormalizeUncCB', 'RemapUnitCB', 'RemapDetectionLimitCB', 'load_provider_lut', 'CleanSedimentCodesCB',
+           'AddSampleIDCB', 'AddDepthCB', 'AddSalinityCB', 'AddStationCB', 'AddTemperatureCB',
+           'RemapSedSliceTopBottomCB', 'CleanBasisCB', 'PercentWeightCB', 'WeightCB', 'ParseCoordinatesCB', 'get_attrs',
+           'pipeline', 'encode']
 
 # %% ../../nbs/handlers/helcom.ipynb #3a8d979f
 from fastcore.all import *
@@ -24,7 +24,7 @@ from ..geo import ddmm_to_dd
 from ..callbacks import (
     Callback, PerGroupCB, Transformer,
     EncodeTimeCB, LowerStripNameCB, SanitizeLonLatCB,
-    CompareDfsAndTfmCB, RemapCB)
+    CompareDfsAndTfmCB, RemapCB, map_unique)
 from ..metadata import GlobAttrsFeeder, BboxCB, DepthRangeCB, TimeRangeCB, ZoteroCB, KeyValuePairCB
 from ..encoders import NetCDFEncoder
 from ..nc2csv import to_csv
@@ -81,6 +81,8 @@ nuclide_lut = make_lut('NUCLIDE', fixes=fixes_nuclide_names)
 # %% ../../nbs/handlers/helcom.ipynb #1a682a3e
 class ParseTimeCB(PerGroupCB):
     "Parse HELCOM DATE (MM/DD/YY HH:MM:SS) with fallback to YEAR/MONTH/DAY."
+    reads,writes = ['date','year','month','day'],['TIME','day','month']
+    row_local = True
     def each_grp(self, grp, df, tfm):
         df['TIME'] = pd.to_datetime(df['date'], format='%m/%d/%y %H:%M:%S', errors='coerce')
         for c in ['day','month']: df.loc[df[c]==0,c] = 1
@@ -108,6 +110,7 @@ coi_sediment = {
 # %% ../../nbs/handlers/helcom.ipynb #83480f98
 class MeltSedimentValuesCB(PerGroupCB):
     "Melt HELCOM dual-value sediment rows into separate rows per measurement type (Bq/kg, Bq/m²)."
+    barrier = True
     grps = ['SEDIMENT']
     def __init__(self, coi:dict  # Column-of-interest mapping, keyed by unit variant (kg, m²)
             ): store_attr()
@@ -130,6 +133,7 @@ coi_val = {'SEAWATER' : {'VALUE': 'value_bq/m³'},
 # %% ../../nbs/handlers/helcom.ipynb #15d74eed
 class SanitizeValueCB(PerGroupCB):
     "Sanitize measurement values by removing blanks and standardizing to use the `VALUE` column."
+    barrier = True
     def __init__(self,
                  coi: Dict[str, Dict[str, str]], # Columns of interest. Format: {group_name: {'VALUE': 'column_name'}}
                  ):
@@ -150,10 +154,12 @@ coi_units_unc = {
 # %% ../../nbs/handlers/helcom.ipynb #9b18c837
 class NormalizeUncCB(PerGroupCB):
     "Convert relative uncertainty (percent) to absolute (standard) uncertainty per group."
+    row_local = True
     def __init__(self,
                  coi: dict=coi_units_unc,  # {group: (meas_col, unc_col)}
                 ):
         store_attr()
+        self.reads,self.writes = [c for cols in coi.values() for c in cols],['UNC']
 
     def each_grp(self, grp, df, tfm):
         if grp not in self.coi: return
@@ -174,6 +180,8 @@ lut_units = {
 # %% ../../nbs/handlers/helcom.ipynb #5ec5a0ef
 class RemapUnitCB(PerGroupCB):
     "Set the MARIS-standard UNIT column from per-sample-type conventions (column name, basis column, or melt result)."
+    reads,writes = ['basis','_UNIT'],['UNIT']
+    row_local = True
     def __init__(self,
                  lut_units: dict=lut_units  # Per-group unit mapping: group -> literal ID or {basis_code -> ID}
                 ):
@@ -181,12 +189,14 @@ class RemapUnitCB(PerGroupCB):
 
     def each_grp(self, grp, df, tfm):
         if grp == 'SEAWATER': df['UNIT'] = self.lut_units[grp]
-        elif grp == 'BIOTA': df['UNIT'] = df['basis'].apply(lambda x: self.lut_units[grp].get(x, 0))
+        elif grp == 'BIOTA': df['UNIT'] = map_unique(df['basis'], lambda x: self.lut_units[grp].get(x, 0))
         elif grp == 'SEDIMENT': df['UNIT'] = df['_UNIT']
 
 # %% ../../nbs/handlers/helcom.ipynb #5ec5a0ef
 class RemapUnitCB(PerGroupCB):
     "Set the MARIS-standard UNIT column from per-sample-type conventions (column name, basis column, or melt result)."
+    reads,writes = ['basis','_UNIT'],['UNIT']
+    row_local = True
     def __init__(self,
                  lut_units: dict=lut_units  # Per-group unit mapping: group -> literal ID or {basis_code -> ID}
                 ):
@@ -194,7 +204,7 @@ class RemapUnitCB(PerGroupCB):
 
     def each_grp(self, grp, df, tfm):
         if grp == 'SEAWATER': df['UNIT'] = self.lut_units[grp]
-        elif grp == 'BIOTA': df['UNIT'] = df['basis'].apply(lambda x: self.lut_units[grp].get(x, 0))
+        elif grp == 'BIOTA': df['UNIT'] = map_unique(df['basis'], lambda x: self.lut_units[grp].get(x, 0))
         elif grp == 'SEDIMENT': df['UNIT'] = df['_UNIT']
 
 # %% ../../nbs/handlers/helcom.ipynb #23cdb129
@@ -205,18 +215,24 @@ coi_dl = {'SEAWATER' : {'DL' : '< value_bq/m³'},
 # %% ../../nbs/handlers/helcom.ipynb #5ae05527
 class RemapDetectionLimitCB(PerGroupCB):
     "Map HELCOM `<` / detected-value conventions to MARIS detection-limit integer codes (2 for DL, 1 for detected)."
+    row_local = True
     def __init__(self, 
                  coi: dict,  # Dict of column hosting the detection limit info for each sample type
                 ):
         store_attr()
+        self.reads,self.writes = [v['DL'] for v in coi.values()],['DL']
         
     def each_grp(self, grp, df, tfm):
         dl = self.coi[grp]['DL']
-        df['DL'] = df[dl].apply(lambda x: 2 if x == '<' else 1)
+        df['DL'] = map_unique(df[dl], lambda x: 2 if x == '<' else 1)
 
-# %% ../../nbs/handlers/helcom.ipynb #ce5aeec4
-provider_lut_species = pd.read_csv(f'{src_dir}/RUBIN_NAME.csv')
-print(provider_lut_species.head())
+# %% ../../nbs/handlers/helcom.ipynb #1634697d
+def load_provider_lut(
+    dfs: dict,  # Group DataFrames (unused: the HELCOM tables don't depend on the data)
+    fname: str, # Name of the provider table under `src_dir`
+    ) -> pd.DataFrame:
+    "Read a HELCOM provider lookup table."
+    return pd.read_csv(f'{src_dir}/{fname}')
 
 # %% ../../nbs/handlers/helcom.ipynb #159de1b1
 fixes_species = {
@@ -227,11 +243,7 @@ fixes_species = {
     }
 
 # %% ../../nbs/handlers/helcom.ipynb #192e3fb3
-species_lut = make_lut_from(provider_lut_species, 'RUBIN', 'SCIENTIFIC NAME', 'SPECIES', fixes=fixes_species)
-
-# %% ../../nbs/handlers/helcom.ipynb #da4a51ed
-provider_lut_tissues = pd.read_csv(f'{src_dir}/TISSUE.csv')
-print(provider_lut_tissues.head())
+species_lut = make_lut_from(partial(load_provider_lut, fname='RUBIN_NAME.csv'), 'RUBIN', 'SCIENTIFIC NAME', 'SPECIES', fixes=fixes_species)
 
 # %% ../../nbs/handlers/helcom.ipynb #c6e2b06f-5eb1-4708-8087-75c836f08112
 fixes_biota_tissues = {
@@ -242,17 +254,13 @@ fixes_biota_tissues = {
     }
 
 # %% ../../nbs/handlers/helcom.ipynb #4c42eb30
-lut_tissues = make_lut_from(provider_lut_tissues,
+lut_tissues = make_lut_from(partial(load_provider_lut, fname='TISSUE.csv'),
                              'TISSUE', 'TISSUE_DESCRIPTION', 'BODY_PART',
                              fixes=fixes_biota_tissues)
 
 # %% ../../nbs/handlers/helcom.ipynb #cf290302
 lut_biogroup = get_lut('SPECIES', key='species_id', value='biogroup_id')
 
-# %% ../../nbs/handlers/helcom.ipynb #7fc9d8bb
-provider_lut_sed = pd.read_csv(f'{src_dir}/SEDIMENT_TYPE.csv')
-print(provider_lut_sed.head())
-
 # %% ../../nbs/handlers/helcom.ipynb #4ea46125
 # Expert overrides for sediment type names
 # 'NO DATA' maps to '(Not available)' rather than 'Not available' due to 
@@ -271,6 +279,8 @@ sed_replace_lut = {56: -99, 73: -99}
 class CleanSedimentCodesCB(PerGroupCB):
     "Replace invalid HELCOM SEDI codes with -99 sentinel before nomenclature lookup."
     grps = ['SEDIMENT']
+    reads,writes = ['sedi'],['sedi']
+    row_local = True
     def __init__(self, 
                  replace_lut # sediment helcom -> maris lookup table
                  ): 
@@ -279,7 +289,7 @@ class CleanSedimentCodesCB(PerGroupCB):
         df['sedi'] = df['sedi'].replace(self.replace_lut).fillna(-99)
 
 # %% ../../nbs/handlers/helcom.ipynb #23fe1d50
-sediment_lut = make_lut_from(provider_lut_sed, 'SEDI', 'SEDIMENT TYPE', 'SED_TYPE', fixes=fixes_sediments)
+sediment_lut = make_lut_from(partial(load_provider_lut, fname='SEDIMENT_TYPE.csv'), 'SEDI', 'SEDIMENT TYPE', 'SED_TYPE', fixes=fixes_sediments)
 
 # %% ../../nbs/handlers/helcom.ipynb #3d2b4bbc
 lut_filtered = {
@@ -291,6 +301,7 @@ lut_filtered = {
 # %% ../../nbs/handlers/helcom.ipynb #b030cb94
 class AddSampleIDCB(PerGroupCB):
     "Assign internal sequential SMP_ID and preserve provider KEY as SMP_ID_PROVIDER."
+    reads,writes = ['key'],['SMP_ID','SMP_ID_PROVIDER']
     def each_grp(self, grp, df, tfm):
         df['SMP_ID'] = range(1, len(df) + 1)
         df['SMP_ID_PROVIDER'] = df['key'].astype(str)
@@ -298,6 +309,8 @@ class AddSampleIDCB(PerGroupCB):
 # %% ../../nbs/handlers/helcom.ipynb #28f14b73
 class AddDepthCB(PerGroupCB):
     "Rename HELCOM sdepth/tdepth columns to MARIS-standard SMP_DEPTH/TOT_DEPTH and cast as float."
+    reads,writes = ['sdepth','tdepth'],['SMP_DEPTH','TOT_DEPTH']
+    row_local = True
     def each_grp(self, grp, df, tfm):
         if 'sdepth' in df.columns: df['SMP_DEPTH'] = df['sdepth'].astype(float)
         if 'tdepth' in df.columns: df['TOT_DEPTH'] = df['tdepth'].astype(float)
@@ -305,18 +318,24 @@ class AddDepthCB(PerGroupCB):
 # %% ../../nbs/handlers/helcom.ipynb #666d97c9
 class AddSalinityCB(PerGroupCB):
     "Add salinity (SAL) from HELCOM salin column where present."
+    reads,writes = ['salin'],['SAL']
+    row_local = True
     def each_grp(self, grp, df, tfm):
         if 'salin' in df.columns: df['SAL'] = df['salin'].astype(float)
 
 # %% ../../nbs/handlers/helcom.ipynb #498f0460
 class AddStationCB(PerGroupCB):
     "Add station to all DataFrames."
+    reads,writes = ['station'],['STATION']
+    row_local = True
     def each_grp(self, grp, df, tfm): df['STATION'] = df['station'].fillna('').astype(str)
 
 # %% ../../nbs/handlers/helcom.ipynb #047afa7e
 class AddTemperatureCB(PerGroupCB):
     "Add temperature (TEMP) from HELCOM ttemp column."
     grps = ['SEAWATER']
+    reads,writes = ['ttemp'],['TEMP']
+    row_local = True
     def each_grp(self, grp, df, tfm): 
         df['TEMP'] = df['ttemp'].astype(float)
 
@@ -325,6 +344,8 @@ class AddTemperatureCB(PerGroupCB):
 class RemapSedSliceTopBottomCB(PerGroupCB):
     "Remap Sediment slice top and bottom to MARIS format."
     grps = ['SEDIMENT']
+    reads,writes = ['uppsli','lowsli'],['TOP','BOTTOM']
+    row_local = True
     def each_grp(self, grp, df, tfm):
         df['TOP'] = df['uppsli']
         df['BOTTOM'] = df['lowsli']
@@ -336,6 +357,8 @@ basis_fix = {'F': 'W'}
 class CleanBasisCB(PerGroupCB):
     "Map basis F to W (BIOTA)."
     grps = ['BIOTA']
+    reads,writes = ['basis'],['basis']
+    row_local = True
     def each_grp(self, grp, df, tfm):
         df['basis'] = df['basis'].replace(basis_fix)
 
@@ -343,6 +366,8 @@ class CleanBasisCB(PerGroupCB):
 class PercentWeightCB(PerGroupCB):
     "Compute PERCENTWT = dw% / 100 (SEDIMENT)."
     grps = ['SEDIMENT']
+    reads,writes = ['dw%'],['PERCENTWT']
+    row_local = True
     def each_grp(self, grp, df, tfm):
         df['PERCENTWT'] = df['dw%'] / 100
         df.loc[df['PERCENTWT'] == 0, 'PERCENTWT'] = np.nan
@@ -351,6 +376,8 @@ class PercentWeightCB(PerGroupCB):
 class WeightCB(PerGroupCB):
     "Compute DRYWT / WETWT from weight + basis (BIOTA)."
     grps = ['BIOTA']
+    reads,writes = ['dw%','basis','weight'],['PERCENTWT','DRYWT','WETWT']
+    row_local = True
     def each_grp(self, grp, df, tfm):
         df['PERCENTWT'] = df['dw%'] / 100
         df.loc[df['PERCENTWT'] == 0, 'PERCENTWT'] = np.nan
@@ -363,10 +390,13 @@ class WeightCB(PerGroupCB):
 # %% ../../nbs/handlers/helcom.ipynb #623f9222
 class ParseCoordinatesCB(PerGroupCB):
     "Parse lat/lon from decimal-degree or degree-minute columns, preferring decimal."
+    barrier,row_local = True,True
+    # Reads undeclared: BIOTA headers have no parentheses around the format ('latitude dddddd' vs 'latitude (dddddd)'),
+    # and declared reads must all be present
+    reads,writes,filters = None,['LON','LAT'],['LON','LAT']
     def __init__(self, fn_convert_cor):
         store_attr()
 
-   
     def each_grp(self, grp, df, tfm):
         cols = df.columns
         lat_d = next(c for c in cols if 'lat' in c.lower() and 'dddddd' in c.lower())
@@ -379,7 +409,7 @@ class ParseCoordinatesCB(PerGroupCB):
             minute = pd.to_numeric(df[min_c], errors='coerce')
             df[name] = dec
             mask = (dec.isna() | (dec == 0)) & minute.notna()
-            df.loc[mask, name] = minute[mask].apply(self.fn_convert_cor)
+            df.loc[mask, name] = map_unique(minute[mask], self.fn_convert_cor)
 
         tfm.dfs[grp] = df[(df['LAT'].notna()) & (df['LON'].notna()) & (df['LAT'] != 0) & (df['LON'] != 0)]
 
@@ -412,6 +442,41 @@ def get_attrs(
         KeyValuePairCB('publisher_postprocess_logs', ', '.join(tfm.logs))
         ])()
 
+# %% ../../nbs/handlers/helcom.ipynb #7ba0d4e8
+# Raw columns whose codes a smoke run (`encode(sample=True)`) should all cover
+sample_keys = ['nuclide', 'basis', 'rubin', 'tissue', 'sedi', 'filt']
+
+def pipeline() -> list:
+    "Callbacks of the HELCOM encoding pipeline, in run order."
+    return [
+        LowerStripNameCB(col_src='nuclide', col_dst='NUCLIDE'),
+        RemapCB(lut=nuclide_lut, col_remap='NUCLIDE', col_src='NUCLIDE'),
+        ParseTimeCB(),
+        EncodeTimeCB(),
+        MeltSedimentValuesCB(coi_sediment),
+        SanitizeValueCB(coi_val),
+        NormalizeUncCB(),
+        RemapUnitCB(),
+        RemapDetectionLimitCB(coi_dl),
+        RemapCB(lut=species_lut, col_remap='SPECIES', col_src='rubin', grps=['BIOTA']),
+        RemapCB(lut=lut_tissues, col_remap='BODY_PART', col_src='tissue', grps=['BIOTA']),
+        RemapCB(lut=lut_biogroup, col_remap='BIO_GROUP', col_src='SPECIES', grps=['BIOTA']),
+        CleanSedimentCodesCB(replace_lut=sed_replace_lut),
+        RemapCB(lut=sediment_lut, col_remap='SED_TYPE', col_src='sedi', grps=['SEDIMENT']),
+        RemapCB(lut=lut_filtered, col_remap='FILT', col_src='filt', grps=['SEAWATER']),
+        AddSampleIDCB(),
+        AddDepthCB(),
+        AddSalinityCB(),
+        AddTemperatureCB(),
+        RemapSedSliceTopBottomCB(),
+        CleanBasisCB(),
+        PercentWeightCB(),
+        WeightCB(),
+        ParseCoordinatesCB(ddmm_to_dd),
+        SanitizeLonLatCB(),
+        AddStationCB()
+    ]
+
 # %% ../../nbs/handlers/helcom.ipynb #1923236b-db58-4173-93ea-c416f5343eba
 def encode(
     fname_out: str, # Output file name
@@ -419,35 +484,10 @@ def encode(
     ) -> None:
     "Encode data to NetCDF."
     dfs = load_data(src_dir)
-    dfs = {k: v.sample(10, random_state=42) for k, v in dfs.items()}
-    tfm = Transformer(dfs, cbs=[
-                            LowerStripNameCB(col_src='nuclide', col_dst='NUCLIDE'),
-                            RemapCB(lut=nuclide_lut, col_remap='NUCLIDE', col_src='NUCLIDE'),
-                            ParseTimeCB(),
-                            EncodeTimeCB(),
-                            MeltSedimentValuesCB(coi_sediment),
-                            SanitizeValueCB(coi_val),
-                            NormalizeUncCB(),
-                            RemapUnitCB(),
-                            RemapDetectionLimitCB(coi_dl),
-                            RemapCB(lut=species_lut, col_remap='SPECIES', col_src='rubin', grps=['BIOTA']),
-                            RemapCB(lut=lut_tissues, col_remap='BODY_PART', col_src='tissue', grps=['BIOTA']),
-                            RemapCB(lut=lut_biogroup, col_remap='BIO_GROUP', col_src='SPECIES', grps=['BIOTA']),
-                            CleanSedimentCodesCB(replace_lut=sed_replace_lut),
-                            RemapCB(lut=sediment_lut, col_remap='SED_TYPE', col_src='sedi', grps=['SEDIMENT']),
-                            RemapCB(lut=lut_filtered, col_remap='FILT', col_src='filt', grps=['SEAWATER']),
-                            AddSampleIDCB(),
-                            AddDepthCB(),
-                            AddSalinityCB(),
-                            AddTemperatureCB(),
-                            RemapSedSliceTopBottomCB(),
-                            CleanBasisCB(),
-                            PercentWeightCB(),
-                            WeightCB(),
-                            ParseCoordinatesCB(ddmm_to_dd),
-                            SanitizeLonLatCB(),
-                            AddStationCB()
-                            ])
+    sample = kwargs.get('sample', False) # True = a few rows of each code of `sample_keys` (see `Transformer`)
+    tfm = Transformer(dfs, cbs=pipeline(), cache=kwargs.get('cache'), 
+                      pushdown=kwargs.get('pushdown', False), prune=kwargs.get('prune', False),
+                      sample=sample_keys if sample is True else sample, sample_min=kwargs.get('sample_min', 1))
     tfm()
     encoder = NetCDFEncoder(tfm.dfs, 
                             dest_fname=fname_out, 
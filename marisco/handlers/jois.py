@@ -2,8 +2,9 @@
 
 # %% auto #0
 __all__ = ['RECORDS', 'fname_out', 'src_dir', 'META_COLS', 'VAL_COLS', 'U238_PPB_TO_AT_KG', 'NUCLIDE_LUT', 'UNIT_LUT',
-           'JOIS_KEYWORDS', 'norm_cols', 'extract_scales', 'apply_scales', 'load_data', 'RenameNucColsCB',
-           'RenameColsCB', 'ParseDateTimeCB', 'MeltJOISCB', 'ConvertU238CB', 'get_attrs', 'encode']
+           'JOIS_KEYWORDS', 'sample_keys', 'norm_cols', 'extract_scales', 'apply_scales', 'load_data',
+           'RenameNucColsCB', 'RenameColsCB', 'ParseDateTimeCB', 'MeltJOISCB', 'ConvertU238CB', 'get_attrs', 'pipeline',
+           'encode']
 
 # %% ../../nbs/handlers/jois.ipynb #d541866d
 from fastcore.all import *
@@ -15,7 +16,7 @@ import zipfile
 import io
 
 from ..callbacks import (PerGroupCB, Callback, Transformer, EncodeTimeCB,
-                                SanitizeLonLatCB, RemapCB, AddSampleIDCB)
+                                SanitizeLonLatCB, RemapCB, AddSampleIDCB, MeltPairsCB)
 from ..metadata import GlobAttrsFeeder, ZoteroCB, BboxCB, DepthRangeCB, TimeRangeCB, KeyValuePairCB
 from ..encoders import NetCDFEncoder
 from ..nc2csv import to_csv
@@ -122,29 +123,17 @@ VAL_COLS = ['I129_at_kg', 'I129_at_l', 'U236_at_kg', 'U236_at_l',
             'U238_at_ppb', 'U236_U238_at_ratio']
 
 # %% ../../nbs/handlers/jois.ipynb #32428840
-class MeltJOISCB(PerGroupCB):
+class MeltJOISCB(MeltPairsCB):
     "Reshape JOIS wide nuclide columns to long format with NUCLIDE, UNIT, VALUE, UNC columns."
-    grps = ['SEAWATER']
     def __init__(self,
                  meta_cols,  # Columns to keep as identifiers
                  val_cols,   # Value columns to melt
                  val_name='VALUE',  # Name of melted value column
                  unc_name='UNC'):   # Name of uncertainty column
-        store_attr()
-    def each_grp(self, grp, df, tfm):
-        vals = df.melt(id_vars=self.meta_cols, value_vars=self.val_cols,
-                       var_name='nuclide_raw', value_name=self.val_name)
-        uncs = df.melt(id_vars=self.meta_cols,
-                       value_vars=[f'unc_{c}' for c in self.val_cols],
-                       value_name=self.unc_name)
-        uncs['nuclide_raw'] = uncs['variable'].str.replace('unc_', '', regex=False)
-        out = vals.merge(uncs[self.meta_cols + ['nuclide_raw', self.unc_name]],
-                         on=self.meta_cols + ['nuclide_raw'])
-        out.dropna(subset=self.val_name, inplace=True)
-        out['NUCLIDE'] = out['nuclide_raw'].str.split('_at_').str[0]
-        out['UNIT']    = 'at_' + out['nuclide_raw'].str.split('_at_').str[1]
-        del out['nuclide_raw']
-        tfm.dfs[grp] = out
+        pairs = [{'val': c, 'unc': f'unc_{c}', 'NUCLIDE': c.split('_at_')[0], 'UNIT': 'at_' + c.split('_at_')[1]} 
+                 for c in val_cols]
+        super().__init__(pairs, grps=['SEAWATER'], keep=meta_cols, val_name=val_name, unc_name=unc_name)
+        self.meta_cols,self.val_cols = meta_cols,val_cols
 
 # %% ../../nbs/handlers/jois.ipynb #5e5ebb16
 # Convert U-238 from ppb to atoms/kg: ppb * 1e-9 * (1/238.05) * 6.02214076e23
@@ -182,13 +171,13 @@ def get_attrs(tfm):
         KeyValuePairCB('publisher_postprocess_logs', ', '.join(tfm.logs)),
     ])()
 
-# %% ../../nbs/handlers/jois.ipynb #1784dfc3
-def encode(fname_out=None  # Output NetCDF file path; defaults to fname_out
-            ):
-    "Encode JOIS data to NetCDF4."
-    fname_out = fname_out or globals().get('fname_out', 'JOIS_Beaufort_Sea.nc')
-    dfs = load_data()
-    tfm = Transformer(dfs, cbs=[
+# %% ../../nbs/handlers/jois.ipynb #71ae53de
+# A single frame with one column per nuclide: `encode(sample=True)` keeps a few rows of each cruise
+sample_keys = ['Cruise']
+
+def pipeline() -> list:
+    "Callbacks of the JOIS encoding pipeline, in run order."
+    return [
         RenameNucColsCB(), RenameColsCB(), ParseDateTimeCB(),
         MeltJOISCB(META_COLS, VAL_COLS),
         ConvertU238CB(),
@@ -199,7 +188,17 @@ def encode(fname_out=None  # Output NetCDF file path; defaults to fname_out
         SanitizeLonLatCB(),
         EncodeTimeCB(),
         AddSampleIDCB(col_provider='SMP_ID_PROVIDER'),
-    ])
+    ]
+
+# %% ../../nbs/handlers/jois.ipynb #1784dfc3
+def encode(fname_out=None, # Output NetCDF file path; defaults to fname_out
+           sample=False,   # Run on a few rows of each code of `sample_keys` (or these columns), for a smoke run
+           sample_min=1,   # Rows of the sample for each code
+            ):
+    "Encode JOIS data to NetCDF4."
+    fname_out = fname_out or globals().get('fname_out', 'JOIS_Beaufort_Sea.nc')
+    dfs = load_data()
+    tfm = Transformer(dfs, cbs=pipeline(), sample=sample_keys if sample is True else sample, sample_min=sample_min)
     tfm()
     encoder = NetCDFEncoder(tfm.dfs, dest_fname=fname_out,
                             global_attrs=get_attrs(tfm))
@@ -3,8 +3,8 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/handlers/maris_legacy.ipynb.
 
 # %% auto #0
-__all__ = ['fname_in', 'dir_dest', 'lut_smp_type', 'cois_renaming_rules', 'lut_dl', 'DataLoader', 'get_zotero_key', 'get_fname',
-           'CastStationToStringCB', 'DropNAColumnsCB', 'AddSampleIDCB']
+__all__ = ['fname_in', 'dir_dest', 'lut_smp_type', 'cois_renaming_rules', 'lut_dl', 'DataLoader', 'iter_dump', 'get_zotero_key',
+           'get_fname', 'CastStationToStringCB', 'DropNAColumnsCB', 'AddSampleIDCB']
 
 # %% ../../nbs/handlers/maris_legacy.ipynb #3a8d979f
 from fastcore.all import *
@@ -57,9 +57,22 @@ class DataLoader:
     def __call__(self,
                  ref_id: int                     # Reference ID of interest, or None for all
                  ) -> dict:                      # {group_name: DataFrame} dict
-        df = self.df[self.df.ref_id == ref_id].copy() if ref_id else self.df.copy()
+        # `groupby` already yields new frames: no defensive copy of the (large) dump needed
+        df = self.df[self.df.ref_id == ref_id] if ref_id else self.df
         return {lut_smp_type[name]: grp for name, grp in df.groupby('samptype') if name in lut_smp_type}
 
+# %% ../../nbs/handlers/maris_legacy.ipynb #3ddf062a
+def iter_dump(
+    fname: str,               # Path to the MARIS global dump CSV
+    ref_id: int=None,         # Reference ID of interest, or None for all
+    chunksize: int=100_000    # Rows read at a time
+    ) -> Iterable[dict]:      # {group_name: DataFrame} chunks
+    "Stream the MARIS dump `chunksize` rows at a time, one `{group_name: DataFrame}` dict per chunk and sample type."
+    for chunk in pd.read_csv(fname, sep='\t', encoding='utf-8', low_memory=False, chunksize=chunksize):
+        if ref_id: chunk = chunk[chunk.ref_id == ref_id]
+        for name, grp in chunk.groupby('samptype'):
+            if name in lut_smp_type: yield {lut_smp_type[name]: grp}
+
 # %% ../../nbs/handlers/maris_legacy.ipynb #09e988c3
 def get_zotero_key(
     dfs:dict  # Dict of {group_name: DataFrame} per sample type
@@ -107,6 +120,7 @@ cois_renaming_rules = {
 # %% ../../nbs/handlers/maris_legacy.ipynb #178e3892
 class CastStationToStringCB(PerGroupCB):
     "Convert STATION column to string type, filling any missing values with empty string"
+    row_local = True
     def each_grp(self, grp, df, tfm):
         if 'STATION' in df.columns:
             df['STATION'] = df['STATION'].fillna('').astype('string')
@@ -133,6 +147,7 @@ lut_dl = get_lut('DL', key='name', value='id')
 # %% ../../nbs/handlers/maris_legacy.ipynb #e5352604
 class AddSampleIDCB(PerGroupCB):
     "Cast SMP_ID to int and SMP_ID_PROVIDER to string (renamed from samplabcode in the pipeline)."
+    row_local = True
     def each_grp(self, grp, df, tfm):
         df['SMP_ID'] = df['SMP_ID'].astype(int)
         df['SMP_ID_PROVIDER'] = df['SMP_ID_PROVIDER'].fillna('').astype(str)
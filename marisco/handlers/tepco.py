@@ -11,7 +11,9 @@ __all__ = ['fname_coastal_water', 'fname_clos1F', 'fname_iaea_orbs', 'fname_out'
            'concat_locs', 'align_dfs', 'concat_dfs', 'georef_data', 'load_data', 'RemoveJapanaseCharCB',
            'FixRangeValueStringCB', 'SelectColsOfInterestCB', 'WideToLongCB', 'extract_nuclide', 'ExtractNuclideNameCB',
            'ExtractUnitCB', 'ExtractValueTypeCB', 'LongToWideCB', 'RemapUnitNameCB', 'RemapNuclideNameCB',
-           'RemapVALUE_DL_DLV_CB', 'ConvertToBqM3CB', 'ParseTimeCB', 'AddSampleIdCB', 'get_attrs', 'encode']
+           'RemapVALUE_DL_DLV_CB', 'ConvertToBqM3CB', 'ParseTimeCB', 'AddSampleIdCB', 'get_attrs', 'sample_keys',
+           'pipeline',
+           'encode']
 
 # %% ../../nbs/handlers/tepco.ipynb #e92f831c
 import warnings
@@ -31,6 +33,7 @@ from marisco.callbacks import (
     EncodeTimeCB, 
     SanitizeLonLatCB,
     EncodeTimeCB, 
+    map_unique
     )
 
 from ..encoders import NetCDFEncoder
@@ -43,8 +46,6 @@ from marisco.metadata import (
     KeyValuePairCB    
     )
 
-from ..netcdf2csv import decode
-
 # %% ../../nbs/handlers/tepco.ipynb #7969707f-98cb-4d7c-9d0a-47f7408d5098
 fname_coastal_water = 'https://radioactivity.nra.go.jp/cont/en/results/sea/coastal_water.csv'
 fname_clos1F = 'https://radioactivity.nra.go.jp/cont/en/results/sea/close1F_water.xlsx'
@@ -216,7 +217,7 @@ class RemoveJapanaseCharCB(Callback):
     def __call__(self, tfm): 
         for k in tfm.dfs.keys():
             cols_rdn = [c for c in tfm.dfs[k].columns if ('(Bq/L)' in c) and (tfm.dfs[k][c].dtype == 'object')]
-            tfm.dfs[k][cols_rdn] = tfm.dfs[k][cols_rdn].map(self._transform_if_about)
+            tfm.dfs[k][cols_rdn] = tfm.dfs[k][cols_rdn].apply(map_unique, fn=self._transform_if_about)
 
 # %% ../../nbs/handlers/tepco.ipynb #07ba7ca4
 class FixRangeValueStringCB(Callback):
@@ -244,7 +245,7 @@ class FixRangeValueStringCB(Callback):
             cols_rdn = [c for c in tfm.dfs[k].columns 
                        if ('(Bq/L)' in c) and (tfm.dfs[k][c].dtype == 'object')]
             # tfm.dfs[k][cols_rdn] = tfm.dfs[k][cols_rdn].map(self._transform_if_range).astype(float)
-            tfm.dfs[k][cols_rdn] = tfm.dfs[k][cols_rdn].map(self._transform_if_range)
+            tfm.dfs[k][cols_rdn] = tfm.dfs[k][cols_rdn].apply(map_unique, fn=self._transform_if_range)
 
 # %% ../../nbs/handlers/tepco.ipynb #03f33095
 common_coi = ['LON', 'LAT', 'TIME', 'STATION']
@@ -283,7 +284,7 @@ class ExtractNuclideNameCB(Callback):
     "Extract nuclide name from TEPCO data."
     def __init__(self, src_col='variable', dest_col='NUCLIDE'): fc.store_attr()
     def __call__(self, tfm): 
-        tfm.dfs['SEAWATER'][self.dest_col] = tfm.dfs['SEAWATER'][self.src_col].map(extract_nuclide)
+        tfm.dfs['SEAWATER'][self.dest_col] = map_unique(tfm.dfs['SEAWATER'][self.src_col], extract_nuclide)
 
 # %% ../../nbs/handlers/tepco.ipynb #d4259772
 class ExtractUnitCB(Callback):
@@ -445,15 +446,13 @@ def get_attrs(tfm, zotero_key, kw=kw):
         KeyValuePairCB('publisher_postprocess_logs', ', '.join(tfm.logs))
         ])()
 
-# %% ../../nbs/handlers/tepco.ipynb #b1db1a74
-def encode(
-    fname_out: str, # Path to the folder where the NetCDF output will be saved
-    **kwargs # Additional keyword arguments
-    ):
-    "Encode TEPCO data to NetCDF."
-    dfs = load_data(fname_coastal_water, fname_clos1F, fname_iaea_orbs)
-    
-    tfm = Transformer(dfs, cbs=[
+# %% ../../nbs/handlers/tepco.ipynb #4108ccf1
+# Stratum of `encode(sample=True)`: measurements are columns, rows are sampling events at a sampling point
+sample_keys = ['Sampling point number']
+
+def pipeline() -> list:
+    "Callbacks of the TEPCO encoding pipeline, in run order."
+    return [
         RemoveJapanaseCharCB(),
         FixRangeValueStringCB(),
         SelectColsOfInterestCB(common_coi, nuclides_pattern),
@@ -470,7 +469,18 @@ def encode(
         EncodeTimeCB(),
         SanitizeLonLatCB(),
         AddSampleIdCB()
-    ])        
+    ]
+
+# %% ../../nbs/handlers/tepco.ipynb #b1db1a74
+def encode(
+    fname_out: str, # Path to the folder where the NetCDF output will be saved
+    **kwargs # Additional keyword arguments
+    ):
+    "Encode TEPCO data to NetCDF."
+    dfs = load_data(fname_coastal_water, fname_clos1F, fname_iaea_orbs)
+    sample = kwargs.get('sample', False) # True = a few rows of each code of `sample_keys` (see `Transformer`)
+    tfm = Transformer(dfs, cbs=pipeline(), cache=kwargs.get('cache'),
+                      sample=sample_keys if sample is True else sample, sample_min=kwargs.get('sample_min', 1))
     tfm()
     encoder = NetCDFEncoder(tfm.dfs, 
                             dest_fname=fname_out, 
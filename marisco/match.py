@@ -5,7 +5,7 @@ Docs: https://franckalbinet.github.io/mariscoapi/match.html.md"""
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/api/match.ipynb.
 
 # %% auto #0
-__all__ = ['uniq_across_dfs', 'lut_from', 'fuzzy_merge', 'fix_lut', 'make_lut_from', 'make_lut']
+__all__ = ['uniq_across_dfs', 'lut_from', 'fuzzy_merge', 'fix_lut', 'provider_lut', 'make_lut_from', 'make_lut']
 
 # %% ../nbs/api/match.ipynb #a8d5cbaf
 import sys
@@ -26,6 +26,8 @@ def uniq_across_dfs(dfs:Dict[str,pd.DataFrame],  # Dict of group DataFrames
                     col:str,                      # Column to extract unique values from
                    )->list:                      # Unique values across all group DataFrames
     "Unique column values across all group DataFrames."
+    # Reuse the `DistinctIndex` of the `Transformer` when called from one of its LUTs
+    if getattr(dfs, 'distinct', None) is not None: return list(dfs.distinct.factorize(col)[1])
     return list(set().union(*(df[col].unique() for df in dfs.values() if col in df.columns)))
 
 # %% ../nbs/api/match.ipynb #62f0f918
@@ -83,6 +85,24 @@ def fix_lut(merged: pd.DataFrame,
     return merged
 
 # %% ../nbs/api/match.ipynb #7111b0dd
+def provider_lut(
+    dfs,                # Dict of group DataFrames, passed to `mk_prov`
+    mk_prov,            # Callable(dict->DataFrame) or static provider DataFrame
+    key_col:str,        # Column name for the Lut key (source value to look up)
+    match_col:str,      # Column in provider LUT to fuzzy-match against MARIS ref
+    maris:pd.DataFrame, # MARIS ref LUT to reconcile against
+    cfg:dict,           # `NC_DTYPES` entry of the MARIS ref LUT (its `key` and `value` columns)
+    fixes:dict=None,    # Expert overrides: {source_value: maris_name}
+    cache_tag:str=None, # If set, cache `merged` as `{cache_tag}.pkl` under cache_path()
+    ) -> dict:          # Lookup dict: source value -> MARIS id
+    "Build the lookup dict of a provider LUT reconciled against the MARIS ref LUT `maris`."
+    cf = cache_path() / f'{cache_tag}.pkl' if cache_tag else None
+    if cf and cf.exists(): return pd.read_pickle(cf)
+    prov = mk_prov(dfs) if callable(mk_prov) else mk_prov
+    m = fuzzy_merge(prov, maris, left_on=match_col, right_on=cfg['key'])
+    if fixes: m = fix_lut(m, fixes, maris, left_on=match_col, right_on=cfg['key'], id_col=cfg['value'])
+    return dict(zip(m[key_col], m[cfg['value']]))
+
 def make_lut_from(
     mk_prov,           # Callable(dict->DataFrame) or static provider DataFrame
     key_col:str,        # Column name for the Lut key (source value to look up)
@@ -91,16 +111,9 @@ def make_lut_from(
     fixes:dict=None,    # Expert overrides: {source_value: maris_name}
     cache_tag:str=None, # If set, cache `merged` as `{cache_tag}.pkl` under cache_path()
     ) -> Callable:       # Function dict->dict: takes dfs, returns lookup dict
-    "Factory: returns a callable that builds a lookup dict from provider data at call time."
-    cfg, maris = NC_DTYPES[lut_key], get_lut(lut_key, as_df=True)
-    def _lut(dfs):
-        cf = cache_path() / f'{cache_tag}.pkl' if cache_tag else None
-        if cf and cf.exists(): return pd.read_pickle(cf)
-        prov = mk_prov(dfs) if callable(mk_prov) else mk_prov
-        m = fuzzy_merge(prov, maris, left_on=match_col, right_on=cfg['key'])
-        if fixes: m = fix_lut(m, fixes, maris, left_on=match_col, right_on=cfg['key'], id_col=cfg['value'])
-        return dict(zip(m[key_col], m[cfg['value']]))
-    return _lut
+    "Factory: returns a picklable callable (a `partial` of `provider_lut`) that builds a lookup dict from provider data at call time."
+    return partial(provider_lut, mk_prov=mk_prov, key_col=key_col, match_col=match_col, 
+                   maris=get_lut(lut_key, as_df=True), cfg=NC_DTYPES[lut_key], fixes=fixes, cache_tag=cache_tag)
 
 # %% ../nbs/api/match.ipynb #1630669d
 def make_lut(
@@ -109,4 +122,4 @@ def make_lut(
         cache_tag:str=None, # If set, cache `merged` as `{cache_tag}.pkl`
         ) -> Callable: # Function dict->dict: takes dfs, returns lookup dict
     "Convenience: derives provider LUT from dfs dict via lut_from, then wraps in make_lut_from."
-    return make_lut_from(lambda dfs: lut_from(dfs, lut_key), 'value', 'value', lut_key, fixes, cache_tag)
+    return make_lut_from(partial(lut_from, col=lut_key), 'value', 'value', lut_key, fixes, cache_tag)
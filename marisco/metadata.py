@@ -14,7 +14,6 @@ import shutil
 import subprocess, json
 import pandas as pd
 from fastcore.all import *
-from cftime import num2date
 from pyzotero import zotero, zotero_errors
 
 from urllib.error import HTTPError, URLError
@@ -24,6 +23,7 @@ import subprocess
 import json
 from typing import Dict, List, Callable
 from .geo import get_bbox 
+from .timecodec import decode_times
 from .configs import get_time_units, ZOTERO_LIB_ID, NC_GLOBAL_ATTRS
 from .callbacks import run_cbs, Callback
 
@@ -91,8 +91,8 @@ class TimeRangeCB(Callback):
     
     def __call__(self, obj):
         time = pd.concat(obj.dfs)[self.time_col]
-        start, end = [num2date(t, units=self.time_unit).isoformat() 
-                      for t in (time.min(), time.max())]
+        # `tolist` gives python datetimes, or `cftime` ones on its fallback: both have `isoformat`
+        start, end = [t.isoformat() for t in decode_times([time.min(), time.max()], self.time_unit).tolist()]
         obj.attrs.update({
             'time_coverage_start': start,
             'time_coverage_end': end})
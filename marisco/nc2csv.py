@@ -13,7 +13,7 @@ from pathlib import Path
 from netCDF4 import Dataset
 import pandas as pd
 from .configs import CSV_VARS, CSV_DTYPES, get_lut, get_time_units, lut_fname, lut_path, SMP_TYPE_LUT, NC_VARS
-from cftime import num2date
+from .timecodec import decode_times
 
 # %% ../nbs/api/nc2csv.ipynb #c20e593d
 def read_nc_grps(
@@ -44,7 +44,8 @@ def decode_time(
     "Decode TIME from epoch seconds to datetime."
     units = get_time_units()
     for df in dfs.values():
-        df['TIME'] = df['TIME'].apply(lambda x: num2date(x, units=units, only_use_cftime_datetimes=False))
+        # Python (or, on the `cftime` fallback, `cftime`) datetimes as before, pandas inferring the dtype
+        df['TIME'] = pd.Series(decode_times(df['TIME'], units).tolist(), index=df.index)
 
 # %% ../nbs/api/nc2csv.ipynb #9e978105
 def add_sample_type(
@@ -0,0 +1,78 @@
+"""Vectorised conversion between datetimes and the template's `<unit> since <origin>` numeric time.
+
+Docs: https://franckalbinet.github.io/mariscoapi/timecodec.html.md"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/api/timecodec.ipynb.
+
+# %% auto #0
+__all__ = ['parse_units', 'encode_times', 'decode_times']
+
+# %% ../nbs/api/timecodec.ipynb #c234ac35
+import re
+import numpy as np
+import pandas as pd
+from cftime import date2num, num2date
+from .configs import get_time_units
+
+# %% ../nbs/api/timecodec.ipynb #65658771
+_UNITS = {'days': 'D', 'day': 'D', 'hours': 'h', 'hour': 'h', 'minutes': 'm', 'minute': 'm', 
+          'seconds': 's', 'second': 's', 'milliseconds': 'ms', 'microseconds': 'us'}
+# Calendars whose dates after the 1582 reform are those of `datetime64` (proleptic Gregorian)
+_GREGORIAN = ('standard', 'gregorian', 'proleptic_gregorian')
+_REFORM = np.datetime64('1582-10-15', 'us')
+
+def parse_units(
+    units: str=None # CF time units e.g. `'seconds since 1970-01-01 00:00:00.0'`; None = template's (see `get_time_units`)
+    ) -> tuple:     # (step in µs, origin as `datetime64[us]`)
+    "Length in microseconds (the resolution of `cftime`) of one time unit, and the origin of CF time `units`."
+    units = units or get_time_units()
+    m = re.fullmatch(r'\s*(\w+)\s+since\s+(.+?)\s*', units)
+    if m is None or m.group(1).lower() not in _UNITS: raise ValueError(f"Unsupported time units: {units!r}")
+    step = np.timedelta64(1, _UNITS[m.group(1).lower()]).astype('timedelta64[us]').astype(np.int64)
+    return int(step), np.datetime64(pd.Timestamp(m.group(2)).tz_localize(None), 'us')
+
+# %% ../nbs/api/timecodec.ipynb #db9cde7d
+def _fast(calendar, *dts):
+    if calendar not in (None,) + _GREGORIAN: return False
+    return calendar in (None, 'proleptic_gregorian') or all(np.all(dt[~np.isnat(dt)] >= _REFORM) for dt in dts)
+
+def encode_times(
+    times,                 # Datetimes: Series, array or list of `datetime64`/`Timestamp`/`datetime`
+    units: str=None,       # CF time units; None = template's
+    calendar: str=None     # CF calendar; None = proleptic Gregorian, as `date2num` assumes for `datetime`s
+    ) -> np.ndarray:       # `int64` if all times fall on whole units, else `float64` (NaN for missing times)
+    "Convert `times` to numbers of `units` since their origin, as `cftime.date2num` does element-wise."
+    step, origin = parse_units(units)
+    dts = np.asarray(pd.to_datetime(pd.Series(times)).dt.tz_localize(None), dtype='datetime64[us]')
+    if not _fast(calendar, dts, np.array([origin])):
+        return np.asarray(date2num(pd.Series(dts).dt.to_pydatetime().tolist(), units=units or get_time_units(), calendar=calendar))
+    missing = np.isnat(dts)
+    delta = dts.astype(np.int64) - origin.astype(np.int64)
+    if not missing.any() and not (delta % step).any(): return delta // step
+    nums = (delta // step) + (delta % step) / step
+    nums[missing] = np.nan
+    return nums
+
+# %% ../nbs/api/timecodec.ipynb #ef2b2ebc
+def decode_times(
+    nums,                  # Numbers of `units` since the origin (NaN = missing)
+    units: str=None,       # CF time units; None = template's
+    calendar: str='standard' # CF calendar
+    ) -> np.ndarray:       # `datetime64[us]`, or `cftime` datetimes (None = missing) for non-standard calendars
+    "Convert numbers of `units` since their origin to datetimes, as `cftime.num2date` does element-wise."
+    step, origin = parse_units(units)
+    nums = np.asarray(nums)
+    if calendar in _GREGORIAN and nums.dtype.kind in 'iuf':
+        missing = np.isnan(nums) if nums.dtype.kind == 'f' else np.zeros(len(nums), dtype=bool)
+        whole = np.floor(np.where(missing, 0, nums))
+        if np.abs(whole).max(initial=0) * step < 2**62:
+            # Sub-unit parts rounded to the microsecond, like `cftime`
+            frac = np.round((np.where(missing, 0, nums) - whole) * step).astype(np.int64)
+            dts = (origin.astype(np.int64) + whole.astype(np.int64) * step + frac).astype('datetime64[us]')
+            dts[missing] = np.datetime64('NaT')
+            if _fast(calendar, dts, np.array([origin])): return dts
+    # `num2date` would decode NaN as the origin: missing times are left to `None`
+    missing = pd.isna(nums)
+    dts = np.full(len(nums), None, dtype=object)
+    dts[~missing] = num2date(nums[~missing], units=units or get_time_units(), calendar=calendar, only_use_cftime_datetimes=False)
+    return dts